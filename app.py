@@ -1,36 +1,167 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, g, Response
+import hashlib
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to Flask's default JSON provider
+import utils.data_manager as data_manager
 from utils.data_manager import load_config, save_config, load_assets, save_assets
-from utils.calculations import calculate_realized_income, calculate_potential_income, calculate_global_position, get_monthly_progress, calculate_total_assets
+from utils.calculations import calculate_realized_income, calculate_potential_income, calculate_global_position_from_values, get_monthly_progress, calculate_total_assets
 from utils.currency import get_exchange_rate
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'mindbank_secret_key_2024'
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """JSON provider backed by orjson's C encoder/decoder"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+# Outside debug the templates never change at runtime, so skip the per-render
+# stat Jinja does when auto_reload is on, and compile both pages up front so
+# the first request doesn't pay the template compilation cost. Debug isn't
+# knowable at import time (app.run(debug=True) sets it later), so the dev
+# entrypoint below re-enables auto-reload before serving.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.get_template('dashboard.html')
+app.jinja_env.get_template('config.html')
+
+@app.before_request
+def stash_request_time():
+    """Capture the request timestamp once so every calculation within the
+    request shares the same clock reading"""
+    g.now = datetime.now()
+
+# Single background worker used to overlap the exchange-rate fetch
+# (potentially a network round-trip) with local data loading
+_fx_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fx')
+
+ASSET_FIELDS = ('bank_balance', 'cash_eur', 'cash_usd', 'investments')
+CONFIG_FIELDS = ('monthly_salary', 'daily_goal_percentage')
+
+def fast_json(data, status=200):
+    """
+    Serialize a response dict straight to bytes with orjson, skipping the
+    str round-trip jsonify makes through the JSON provider. Falls back to
+    jsonify when orjson isn't installed.
+    """
+    if orjson is not None:
+        return Response(orjson.dumps(data), status=status, mimetype='application/json')
+    response = jsonify(data)
+    response.status_code = status
+    return response
+
+def error_response(message, status):
+    """Build the standard JSON error payload"""
+    return fast_json({'success': False, 'error': message}, status)
+
+def parse_float_fields(data, fields):
+    """
+    Validate and coerce the given payload fields to finite floats in a
+    single pass. Returns (parsed_dict, None) on success or
+    (None, error_message) on the first failure.
+    """
+    parsed = {}
+    for field in fields:
+        if field not in data:
+            return None, f'Missing required field: {field}'
+        try:
+            value = float(data[field])
+        except (ValueError, TypeError):
+            return None, f'Invalid value for {field}: must be a number'
+        if not math.isfinite(value):
+            return None, f'Invalid value for {field}: must be a number'
+        parsed[field] = value
+    return parsed, None
+
+def compute_data_etag(extra=''):
+    """
+    Build a short ETag from the data file mtimes and the current date.
+    The dashboard values only change when a data file is written or the
+    calendar day rolls over, so this is enough to detect staleness.
+    """
+    parts = []
+    for path in (data_manager.CONFIG_FILE, data_manager.ASSETS_FILE):
+        try:
+            parts.append(str(os.stat(path).st_mtime_ns))
+        except OSError:
+            parts.append('0')
+    parts.append(g.now.strftime('%Y%m%d'))
+    if extra:
+        parts.append(extra)
+    return hashlib.blake2b('|'.join(parts).encode(), digest_size=8).hexdigest()
+
+def build_dashboard_context(fx_future=None):
+    """
+    Load data and compute the income/position values shared by the
+    dashboard page and the AJAX refresh endpoint. If a future for the
+    exchange-rate lookup is given, it is resolved here (after the local
+    loads) and used for the USD conversion in the global position.
+    """
+    config = load_config()
+    assets = load_assets()
+
+    realized_income = calculate_realized_income(config.get('monthly_salary', 0), now=g.now)
+    potential_income = calculate_potential_income(
+        config.get('monthly_salary', 0),
+        config.get('daily_goal_percentage', 0),
+        now=g.now
+    )
+
+    exchange_rate = None
+    if fx_future is not None:
+        try:
+            exchange_rate = fx_future.result()
+        except Exception:
+            exchange_rate = None  # Fallback to no conversion
+
+    global_position = calculate_global_position_from_values(assets, realized_income, potential_income, exchange_rate)
+
+    return {
+        'config': config,
+        'assets': assets,
+        'realized_income': realized_income,
+        'potential_income': potential_income,
+        'global_position': global_position,
+        'exchange_rate': exchange_rate
+    }
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
     try:
-        config = load_config()
-        assets = load_assets()
-        
-        # Calculate income components
-        realized_income = calculate_realized_income(config.get('monthly_salary', 0))
-        potential_income = calculate_potential_income(
-            config.get('monthly_salary', 0), 
-            config.get('daily_goal_percentage', 0)
-        )
-        
-        # Calculate global position
-        global_position = calculate_global_position(assets, realized_income, potential_income)
-        
-        return render_template('dashboard.html', 
-                             config=config,
-                             assets=assets,
-                             realized_income=realized_income,
-                             potential_income=potential_income,
-                             global_position=global_position)
-    except Exception as e:
+        # Answer browser refreshes with 304 when nothing has changed,
+        # skipping the calculations and template render entirely
+        etag = compute_data_etag()
+        if request.if_none_match.contains(etag):
+            return '', 304
+
+        ctx = build_dashboard_context()
+
+        response = app.make_response(render_template('dashboard.html',
+                                                     config=ctx['config'],
+                                                     assets=ctx['assets'],
+                                                     realized_income=ctx['realized_income'],
+                                                     potential_income=ctx['potential_income'],
+                                                     global_position=ctx['global_position']))
+        response.set_etag(etag)
+        return response
+    except Exception:
         # If no config exists, redirect to config page
         return render_template('dashboard.html', 
                              config={},
@@ -56,110 +187,79 @@ def config():
 def update_assets():
     """Update asset values"""
     try:
-        # Check if request has JSON data
-        if not request.is_json:
-            return jsonify({'success': False, 'error': 'JSON data required'}), 400
-        
-        data = request.get_json()
+        # Parse the JSON body in one step (get_json also checks Content-Type)
+        data = request.get_json(silent=True, cache=False)
         if data is None:
-            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+            return error_response('JSON data required', 400)
         
-        # Validate required fields
-        required_fields = ['bank_balance', 'cash_eur', 'cash_usd', 'investments']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'success': False, 'error': f'Missing required field: {field}'}), 400
-        
-        # Validate and convert input
-        assets = {}
-        for field in required_fields:
-            try:
-                assets[field] = float(data[field])
-            except (ValueError, TypeError):
-                return jsonify({'success': False, 'error': f'Invalid value for {field}: must be a number'}), 400
+        # Validate and convert input in one pass
+        assets, error = parse_float_fields(data, ASSET_FIELDS)
+        if error:
+            return error_response(error, 400)
         
         # Try to save assets
         try:
             save_assets(assets)
         except Exception as save_error:
-            return jsonify({'success': False, 'error': f'Failed to save assets: {str(save_error)}'}), 500
+            return error_response(f'Failed to save assets: {save_error}', 500)
         
-        return jsonify({'success': True, 'message': 'Assets updated successfully', 'assets': assets})
+        return fast_json({'success': True, 'message': 'Assets updated successfully', 'assets': assets})
     
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return error_response(str(e), 400)
 
 @app.route('/api/update-config', methods=['POST'])
 def update_config():
     """Update configuration"""
     try:
-        # Check if request has JSON data
-        if not request.is_json:
-            return jsonify({'success': False, 'error': 'JSON data required'}), 400
-        
-        data = request.get_json()
+        # Parse the JSON body in one step (get_json also checks Content-Type)
+        data = request.get_json(silent=True, cache=False)
         if data is None:
-            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
-        
-        # Validate required fields
-        required_fields = ['monthly_salary', 'daily_goal_percentage']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'success': False, 'error': f'Missing required field: {field}'}), 400
+            return error_response('JSON data required', 400)
         
-        # Validate and convert input
-        try:
-            monthly_salary = float(data['monthly_salary'])
-            daily_goal_percentage = float(data['daily_goal_percentage'])
-        except (ValueError, TypeError):
-            return jsonify({'success': False, 'error': 'Invalid numeric values provided'}), 400
-        
-        # Validate ranges
-        if monthly_salary < 0:
-            return jsonify({'success': False, 'error': 'Monthly salary must be non-negative'}), 400
-        if not 0 <= daily_goal_percentage <= 100:
-            return jsonify({'success': False, 'error': 'Daily goal percentage must be between 0 and 100'}), 400
-        
-        config = {
-            'monthly_salary': monthly_salary,
-            'daily_goal_percentage': daily_goal_percentage
-        }
+        # Validate and convert input in one pass (non-finite values rejected)
+        config, error = parse_float_fields(data, CONFIG_FIELDS)
+        if error:
+            return error_response(error, 400)
+
+        # Validate ranges (values are guaranteed finite by the parse above)
+        if config['monthly_salary'] < 0:
+            return error_response('Monthly salary must be non-negative', 400)
+        if (config['daily_goal_percentage'] < 0) | (config['daily_goal_percentage'] > 100):
+            return error_response('Daily goal percentage must be between 0 and 100', 400)
         
         # Try to save config
         try:
             save_config(config)
         except Exception as save_error:
-            return jsonify({'success': False, 'error': f'Failed to save configuration: {str(save_error)}'}), 500
+            return error_response(f'Failed to save configuration: {save_error}', 500)
         
-        return jsonify({'success': True, 'message': 'Configuration updated successfully', 'config': config})
+        return fast_json({'success': True, 'message': 'Configuration updated successfully', 'config': config})
     
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return error_response(str(e), 400)
 
 @app.route('/api/daily-goal', methods=['POST'])
 def update_daily_goal():
     """Update daily goal percentage and return new calculations"""
     try:
-        # Check if request has JSON data
-        if not request.is_json:
-            return jsonify({'success': False, 'error': 'JSON data required'}), 400
-        
-        data = request.get_json()
+        # Parse the JSON body in one step (get_json also checks Content-Type)
+        data = request.get_json(silent=True, cache=False)
         if data is None:
-            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+            return error_response('JSON data required', 400)
         
         # Validate goal_percentage field
         if 'goal_percentage' not in data:
-            return jsonify({'success': False, 'error': 'Missing required field: goal_percentage'}), 400
+            return error_response('Missing required field: goal_percentage', 400)
         
         try:
             goal_percentage = float(data['goal_percentage'])
         except (ValueError, TypeError):
-            return jsonify({'success': False, 'error': 'Invalid goal_percentage: must be a number'}), 400
+            return error_response('Invalid goal_percentage: must be a number', 400)
         
-        # Validate percentage range
-        if not 0 <= goal_percentage <= 100:
-            return jsonify({'success': False, 'error': 'Goal percentage must be between 0 and 100'}), 400
+        # Validate percentage range (isfinite first: NaN compares False everywhere)
+        if not math.isfinite(goal_percentage) or (goal_percentage < 0) | (goal_percentage > 100):
+            return error_response('Goal percentage must be between 0 and 100', 400)
         
         # Load current config and update goal percentage
         try:
@@ -167,18 +267,18 @@ def update_daily_goal():
             config['daily_goal_percentage'] = goal_percentage
             save_config(config)
         except Exception as config_error:
-            return jsonify({'success': False, 'error': f'Failed to update configuration: {str(config_error)}'}), 500
+            return error_response(f'Failed to update configuration: {config_error}', 500)
         
         # Recalculate everything
         try:
             assets = load_assets()
-            realized_income = calculate_realized_income(config.get('monthly_salary', 0))
-            potential_income = calculate_potential_income(config.get('monthly_salary', 0), goal_percentage)
-            global_position = calculate_global_position(assets, realized_income, potential_income)
+            realized_income = calculate_realized_income(config.get('monthly_salary', 0), now=g.now)
+            potential_income = calculate_potential_income(config.get('monthly_salary', 0), goal_percentage, now=g.now)
+            global_position = calculate_global_position_from_values(assets, realized_income, potential_income)
         except Exception as calc_error:
-            return jsonify({'success': False, 'error': f'Failed to calculate values: {str(calc_error)}'}), 500
+            return error_response(f'Failed to calculate values: {calc_error}', 500)
         
-        return jsonify({
+        return fast_json({
             'success': True,
             'message': 'Daily goal updated successfully',
             'potential_income': potential_income,
@@ -187,37 +287,41 @@ def update_daily_goal():
         })
     
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
+        return error_response(str(e), 400)
 
 @app.route('/api/dashboard-data')
 def get_dashboard_data():
     """Get current dashboard data for AJAX refresh"""
     try:
-        # Load data with error handling
+        # Kick off the exchange-rate lookup in the background so the
+        # (potential) network round-trip overlaps the local file loads
+        fx_future = _fx_executor.submit(get_exchange_rate)
+
+        # Build the shared dashboard context (loads + income calculations)
         try:
-            config = load_config()
-            assets = load_assets()
+            ctx = build_dashboard_context(fx_future)
         except Exception as load_error:
-            return jsonify({'success': False, 'error': f'Failed to load data: {str(load_error)}'}), 500
-        
-        # Get exchange rate
-        try:
-            exchange_rate = get_exchange_rate()
-        except Exception:
-            exchange_rate = None  # Fallback to no conversion
-        
-        # Calculate values with error handling
+            fx_future.cancel()
+            return error_response(f'Failed to load data: {load_error}', 500)
+
+        config = ctx['config']
+        assets = ctx['assets']
+        exchange_rate = ctx['exchange_rate']
+        realized_income = ctx['realized_income']
+        potential_income = ctx['potential_income']
+        global_position = ctx['global_position']
+
+        # Short-circuit AJAX polling with 304 when nothing has changed
+        etag = compute_data_etag('' if exchange_rate is None else str(exchange_rate))
+        if request.if_none_match.contains(etag):
+            return '', 304
+
         try:
-            realized_income = calculate_realized_income(config.get('monthly_salary', 0))
-            potential_income = calculate_potential_income(
-                config.get('monthly_salary', 0), 
-                config.get('daily_goal_percentage', 0)
-            )
-            global_position = calculate_global_position(assets, realized_income, potential_income, exchange_rate)
-            monthly_progress = get_monthly_progress()
+            monthly_progress = get_monthly_progress(g.now)
         except Exception as calc_error:
-            return jsonify({'success': False, 'error': f'Failed to calculate values: {str(calc_error)}'}), 500
-        
+            return error_response(f'Failed to calculate values: {calc_error}', 500)
+
+
         response_data = {
             'success': True,
             'config': config,
@@ -236,24 +340,29 @@ def get_dashboard_data():
         
         if exchange_rate is not None:
             response_data['exchange_rate'] = exchange_rate
-        
-        return jsonify(response_data)
+
+        response = fast_json(response_data)
+        response.set_etag(etag)
+        return response
     
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 @app.route('/api/exchange-rate')
 def get_current_exchange_rate():
     """Get current USD to EUR exchange rate"""
     try:
-        import datetime
         rate = get_exchange_rate()
-        timestamp = datetime.datetime.now().isoformat()
-        return jsonify({'success': True, 'rate': rate, 'source': 'exchangerate-api', 'timestamp': timestamp})
+        timestamp = g.now.isoformat()
+        return fast_json({'success': True, 'rate': rate, 'source': 'exchangerate-api', 'timestamp': timestamp})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 if __name__ == '__main__':
     # Ensure data directory exists
     os.makedirs('data', exist_ok=True)
+    # Debug run: turn template auto-reload back on so edits show up
+    # without a restart (the import-time default assumes a WSGI server)
+    app.config['TEMPLATES_AUTO_RELOAD'] = True
+    app.jinja_env.auto_reload = True
     app.run(debug=True, host='0.0.0.0', port=5555) 
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""Gunicorn configuration for running MindBank in production"""
+
+import multiprocessing
+
+bind = '0.0.0.0:5555'
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = 'sync'
+
+# Recycle workers periodically to keep memory bounded
+max_requests = 1000
+max_requests_jitter = 50
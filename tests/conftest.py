@@ -7,33 +7,62 @@ import tempfile
 import shutil
 import os
 import json
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 # Add the project root to the path
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app import app
+from tests.helpers import CURRENCY_NOW
 from utils.data_manager import CONFIG_FILE, ASSETS_FILE
 from utils.currency import CACHE_FILE
 
+# Configure the app exactly once at import; re-writing these keys in the
+# fixture would just repeat the same config-dict writes for every session
+app.config.update(TESTING=True, SECRET_KEY='test_secret_key')
 
-@pytest.fixture
+
+@pytest.fixture(scope='session', autouse=True)
+def _prewarm():
+    """Warm the Jinja template cache and URL map once per session.
+
+    Without this the first routed test in a session (or xdist worker) pays
+    the template-compile and rule-compile cost, which skews --durations.
+    """
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    adapter = app.url_map.bind('localhost')
+    adapter.match('/')
+
+
+@pytest.fixture(scope='session')
 def client():
-    """Create a test client for the Flask application"""
-    app.config['TESTING'] = True
-    app.config['SECRET_KEY'] = 'test_secret_key'
-    
+    """
+    Create a test client for the Flask application.
+
+    Session-scoped: the client itself is stateless (all state lives in the
+    data files, which temp_data_dir isolates per test), so there is no need
+    to rebuild it for every test.
+    """
     with app.test_client() as client:
         with app.app_context():
             yield client
 
 
+# Back test data dirs with tmpfs where the platform offers it (Linux), so
+# the per-test config/assets writes never touch a real disk
+_TMP_BASE = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
 @pytest.fixture
 def temp_data_dir():
     """Create a temporary directory for test data files"""
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = tempfile.mkdtemp(dir=_TMP_BASE)
     
     # Override the data file paths to use temp directory
     original_config_file = CONFIG_FILE
@@ -59,6 +88,35 @@ def temp_data_dir():
     curr.CACHE_FILE = original_cache_file
 
 
+# With the clock frozen at CURRENCY_NOW the same handful of offsets recurs
+# across the suite, so each ISO string is built exactly once
+@lru_cache(maxsize=None)
+def _iso_offset(minutes_ago):
+    return (CURRENCY_NOW - timedelta(minutes=minutes_ago)).isoformat()
+
+
+@pytest.fixture
+def write_cache(temp_data_dir):
+    """Factory that stages an exchange-rate cache file in one write.
+
+    Timestamps are offsets from CURRENCY_NOW, so callers should pair this
+    with frozen_currency_time whenever the cache's age matters. json.dumps
+    plus a single write() replaces the token-by-token streaming of
+    json.dump.
+    """
+    def _write(rate=0.8542, minutes_ago=5, source='api', timestamp=None):
+        cache_data = {
+            'rate': rate,
+            'timestamp': timestamp or _iso_offset(minutes_ago),
+            'source': source
+        }
+        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
+        with open(cache_path, 'w') as f:
+            f.write(json.dumps(cache_data))
+        return cache_data
+    return _write
+
+
 @pytest.fixture
 def sample_config():
     """Sample user configuration data"""
@@ -93,19 +151,77 @@ def sample_exchange_rate():
     }
 
 
+# Canned API response shared by every mock_exchange_api use. Built once:
+# tests only read .json()/.raise_for_status() from it, so there is no need
+# to reconstruct the mock tree per test.
+_EXCHANGE_API_RESPONSE = MagicMock()
+_EXCHANGE_API_RESPONSE.json.return_value = {
+    'rates': {
+        'EUR': 0.8542
+    }
+}
+_EXCHANGE_API_RESPONSE.raise_for_status.return_value = None
+
+
 @pytest.fixture
-def mock_exchange_api():
-    """Mock the exchange rate API response"""
-    with patch('requests.get') as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            'rates': {
-                'EUR': 0.8542
-            }
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        yield mock_get
+def mock_exchange_api(monkeypatch):
+    """Mock the exchange rate API response.
+
+    Patches at the HTTP session layer, so get_exchange_rate's parsing and
+    caching still run — use this in tests that exercise the currency module
+    itself. App-level tests that only need a rate should prefer
+    mock_exchange_rate below.
+    """
+    # Fresh mock per test (call counts are asserted), pointing at the
+    # prebuilt response; monkeypatch restores the session method automatically
+    mock_get = MagicMock(return_value=_EXCHANGE_API_RESPONSE)
+    monkeypatch.setattr('utils.currency._session.get', mock_get)
+    yield mock_get
+
+
+@pytest.fixture
+def make_response():
+    """Factory for minimal API response mocks.
+
+    spec= limits the mock to json/raise_for_status, which also keeps its
+    construction cheaper than a fully dynamic Mock.
+    """
+    def _make(json_data=None, json_error=None, http_error=None):
+        response = Mock(spec=['json', 'raise_for_status'])
+        if json_error is not None:
+            response.json.side_effect = json_error
+        else:
+            response.json.return_value = json_data
+        if http_error is not None:
+            response.raise_for_status.side_effect = http_error
+        else:
+            response.raise_for_status.return_value = None
+        return response
+    return _make
+
+
+@pytest.fixture
+def mock_fetch_rate(monkeypatch):
+    """Stub utils.currency.fetch_rate_from_api with a MagicMock.
+
+    Opt-in rather than autouse: some tests exercise the real fetch path
+    through mock_exchange_api instead. monkeypatch.setattr is a single
+    setattr versus patch()'s dotted-path resolution per test; tests tweak
+    return_value (e.g. to None for the API-failure cases) as needed.
+    """
+    mock_api = MagicMock(return_value=0.8542)
+    monkeypatch.setattr('utils.currency.fetch_rate_from_api', mock_api)
+    return mock_api
+
+
+@pytest.fixture
+def mock_exchange_rate(monkeypatch):
+    """Stub app.get_exchange_rate with a constant rate.
+
+    Skips the currency module's fetch/parse/cache path entirely for tests
+    that only care about the final float.
+    """
+    monkeypatch.setattr('app.get_exchange_rate', lambda: 0.8542)
 
 
 @pytest.fixture
@@ -128,21 +244,85 @@ def populated_data_files(temp_data_dir, sample_config, sample_assets):
     }
 
 
+# Plain stand-ins for the datetime class and calendar module as seen by
+# utils.calculations (which only ever calls datetime.now() and
+# calendar.monthrange). Swapping these in with monkeypatch avoids building
+# a MagicMock patch stack per test.
+class _FrozenDatetime:
+    _now = None
+
+    @classmethod
+    def now(cls):
+        return cls._now
+
+
+class _FrozenCalendar:
+    _days = None
+
+    @classmethod
+    def monthrange(cls, year, month):
+        return (0, cls._days)
+
+
+class _FrozenCurrencyDatetime(datetime):
+    """datetime subclass with a pinned now().
+
+    utils.currency also calls datetime.fromisoformat() on cached
+    timestamps, so unlike _FrozenDatetime this must stay a real datetime
+    class rather than a bare shim.
+    """
+    _now = None
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls._now
+
+
+_DEFAULT_FROZEN_DATE = (datetime(2024, 7, 15, 12, 0, 0), 31)
+
+
+@pytest.fixture
+def frozen_date(request, monkeypatch):
+    """Freeze utils.calculations' view of time and month length.
+
+    Parametrize indirectly with a (datetime, days_in_month) tuple; without
+    a param it defaults to July 15th 2024 in a 31-day month.
+    """
+    date, days = getattr(request, 'param', _DEFAULT_FROZEN_DATE)
+    monkeypatch.setattr(_FrozenDatetime, '_now', date)
+    monkeypatch.setattr(_FrozenCalendar, '_days', days)
+    monkeypatch.setattr('utils.calculations.datetime', _FrozenDatetime)
+    monkeypatch.setattr('utils.calculations.calendar', _FrozenCalendar)
+    return date
+
+
 @pytest.fixture
-def frozen_time():
+def frozen_currency_time(monkeypatch):
+    """Freeze utils.currency's view of time to helpers.CURRENCY_NOW.
+
+    Lets currency tests write cache timestamps as fixed offsets from the
+    anchor instead of recomputing them from the real clock, which was
+    flaky right at the one-hour expiry boundary.
+    """
+    monkeypatch.setattr(_FrozenCurrencyDatetime, '_now', CURRENCY_NOW)
+    monkeypatch.setattr('utils.currency.datetime', _FrozenCurrencyDatetime)
+    return CURRENCY_NOW
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
     """Freeze time to a specific date for consistent testing"""
     frozen_date = datetime(2024, 7, 15, 12, 0, 0)  # July 15th, 2024, midday
-    
-    with patch('utils.calculations.datetime') as mock_datetime:
-        mock_datetime.now.return_value = frozen_date
-        mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
-        yield frozen_date
 
+    # Thin setter over the shared _FrozenDatetime shim - no Mock machinery
+    monkeypatch.setattr(_FrozenDatetime, '_now', frozen_date)
+    monkeypatch.setattr('utils.calculations.datetime', _FrozenDatetime)
+    yield frozen_date
 
-@pytest.fixture
-def api_test_data():
-    """Test data for API endpoint testing"""
-    return {
+
+# Read-only API payloads built once; MappingProxyType makes any accidental
+# mutation by a test fail loudly instead of leaking into later tests
+_API_TEST_DATA = types.MappingProxyType({
         'valid_config': {
             'monthly_salary': 4000.0,
             'daily_goal_percentage': 80.0
@@ -169,25 +349,32 @@ def api_test_data():
         'invalid_goal_update': {
             'goal_percentage': 120.0  # Invalid percentage > 100
         }
-    }
+    })
+
+
+@pytest.fixture(scope='session')
+def api_test_data():
+    """Test data for API endpoint testing (shared, read-only)"""
+    return _API_TEST_DATA
 
 
 @pytest.fixture
-def mock_calendar():
-    """Mock calendar module for consistent testing"""
-    with patch('utils.calculations.calendar') as mock_cal:
-        # Mock July 2024 has 31 days
-        mock_cal.monthrange.return_value = (0, 31)  # (weekday, days_in_month)
-        yield mock_cal
+def mock_calendar(monkeypatch):
+    """Fix calendar to a 31-day month for consistent testing"""
+    # Thin setter over the shared _FrozenCalendar shim - no Mock machinery
+    monkeypatch.setattr(_FrozenCalendar, '_days', 31)
+    monkeypatch.setattr('utils.calculations.calendar', _FrozenCalendar)
+    yield _FrozenCalendar
 
 
 @pytest.fixture(autouse=True)
 def reset_modules():
     """Reset module state before each test"""
     # Clear any cached data in modules
+    import utils.calculations as calc
     import utils.data_manager as dm
     import utils.currency as curr
-    
+
     # Reset any module-level caches if they exist
     if hasattr(dm, '_config_cache'):
         dm._config_cache = None
@@ -195,6 +382,25 @@ def reset_modules():
         dm._assets_cache = None
     if hasattr(curr, '_rate_cache'):
         curr._rate_cache = None
+    if hasattr(curr, '_parse_cache'):
+        curr._parse_cache = None
+    if hasattr(dm, '_data_dir_ready'):
+        dm._data_dir_ready = False
+    # The month-length memo must not leak across tests: the calendar shims
+    # installed by frozen_date/mock_calendar can legitimately report
+    # different lengths for the same (year, month) key
+    calc._days_in_month.cache_clear()
+
+
+@pytest.fixture(scope='session')
+def executor():
+    """Shared thread pool for concurrency tests.
+
+    Session-scoped so the OS threads are created once and reused instead of
+    being spawned and joined per test.
+    """
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        yield ex
 
 
 @pytest.fixture
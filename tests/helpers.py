@@ -0,0 +1,47 @@
+"""
+Shared helpers for MindBank application tests
+"""
+
+import json
+from datetime import datetime
+
+from werkzeug.test import EnvironBuilder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Anchor for tests that freeze utils.currency's clock (see the
+# frozen_currency_time fixture in conftest.py). Cache timestamps in the
+# currency tests are expressed relative to this instant, so cache-expiry
+# assertions no longer depend on the real clock.
+CURRENCY_NOW = datetime(2025, 1, 15, 12, 0, 0)
+CURRENCY_NOW_ISO = CURRENCY_NOW.isoformat()
+
+
+def post_json(client, url, payload):
+    """POST a JSON payload, encoding the body with orjson when available
+    instead of going through Werkzeug's stdlib json.dumps path"""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload)
+    return client.post(url, data=body, content_type='application/json')
+
+
+def wsgi_status(app, path, method='GET'):
+    """Dispatch a request straight through the WSGI stack and return the
+    status code, skipping the test client's Response wrapping and cookie
+    jar. Only useful for tests that assert on nothing but the status."""
+    builder = EnvironBuilder(path=path, method=method)
+    captured = []
+
+    def start_response(status, headers, exc_info=None):
+        captured.append(status)
+
+    body = app.wsgi_app(builder.get_environ(), start_response)
+    if hasattr(body, 'close'):
+        body.close()
+    builder.close()
+    return int(captured[0].split(' ', 1)[0])
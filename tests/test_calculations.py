@@ -4,18 +4,41 @@ Tests financial calculations, time-based calculations, and edge cases
 """
 
 import pytest
-import calendar
+from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import patch, Mock
+from math import isclose
+from types import MappingProxyType
 
 from utils.calculations import (
     calculate_realized_income, calculate_potential_income,
     calculate_total_assets, calculate_global_position,
+    calculate_global_position_from_values, calculate_global_position_from_salary,
     calculate_monthly_progress, calculate_realized_monthly_income,
     calculate_potential_daily_income, get_monthly_progress,
-    validate_percentage
+    compute_financials, validate_percentage
 )
 
+# Shared (date, days_in_month) params for the indirect frozen_date fixture,
+# constructed once at import instead of per decorator
+_JUL_1 = (datetime(2024, 7, 1, 12, 0, 0), 31)
+_JUL_31 = (datetime(2024, 7, 31, 12, 0, 0), 31)
+_FEB_14_LEAP = (datetime(2024, 2, 14, 12, 0, 0), 29)
+_FEB_15_LEAP = (datetime(2024, 2, 15, 12, 0, 0), 29)
+
+# Canonical read-only asset dicts, built once at import instead of per test
+_SAMPLE_ASSETS = MappingProxyType({
+    'bank_balance': 5000.0,
+    'cash_eur': 200.0,
+    'cash_usd': 100.0,
+    'investments': 10000.0
+})
+_ZERO_ASSETS = MappingProxyType({
+    'bank_balance': 0.0,
+    'cash_eur': 0.0,
+    'cash_usd': 0.0,
+    'investments': 0.0
+})
+
 
 class TestRealizedIncome:
     """Test realized income calculations"""
@@ -29,14 +52,14 @@ class TestRealizedIncome:
         
         # Expected: (15 days / 31 days) * 3000 = 1451.61 (no goal percentage since not provided)
         expected = (15 / 31) * 3000
-        assert abs(result - expected) < 0.01
+        assert isclose(result, expected, abs_tol=0.01)
     
-    def test_zero_salary(self, frozen_time, mock_calendar):
+    def test_zero_salary(self):
         """Test with zero salary"""
         result = calculate_realized_monthly_income(0.0, 75.0)
         assert result == 0.0
     
-    def test_zero_goal_percentage(self, frozen_time, mock_calendar):
+    def test_zero_goal_percentage(self):
         """Test with zero goal percentage"""
         result = calculate_realized_monthly_income(3000.0, 0.0)
         assert result == 0.0
@@ -50,53 +73,66 @@ class TestRealizedIncome:
         
         # Expected: (15 days / 31 days) * 3000 * 1.0 = 1451.61
         expected = (15 / 31) * 3000 * 1.0
-        assert abs(result - expected) < 0.01
+        assert isclose(result, expected, abs_tol=0.01)
     
-    def test_first_day_of_month(self, mock_calendar):
+    @pytest.mark.parametrize('frozen_date', [_JUL_1], indirect=True)
+    def test_first_day_of_month(self, frozen_date):
         """Test calculation on first day of month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 1, 12, 0, 0)
-            
-            result = calculate_realized_monthly_income(3000.0, 75.0)
-            
-            # Expected: (1 day / 31 days) * 3000 * 0.75 = 72.58
-            expected = (1 / 31) * 3000 * 0.75
-            assert abs(result - expected) < 0.01
-    
-    def test_last_day_of_month(self, mock_calendar):
+        result = calculate_realized_monthly_income(3000.0, 75.0)
+
+        # Expected: (1 day / 31 days) * 3000 * 0.75 = 72.58
+        expected = (1 / 31) * 3000 * 0.75
+        assert isclose(result, expected, abs_tol=0.01)
+
+    @pytest.mark.parametrize('frozen_date', [_JUL_31], indirect=True)
+    def test_last_day_of_month(self, frozen_date):
         """Test calculation on last day of month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 31, 12, 0, 0)
-            
-            result = calculate_realized_monthly_income(3000.0, 75.0)
-            
-            # Expected: (31 days / 31 days) * 3000 * 0.75 = 2250.0
-            expected = (31 / 31) * 3000 * 0.75
-            assert abs(result - expected) < 0.01
-    
-    def test_february_leap_year(self):
+        result = calculate_realized_monthly_income(3000.0, 75.0)
+
+        # Expected: (31 days / 31 days) * 3000 * 0.75 = 2250.0
+        expected = (31 / 31) * 3000 * 0.75
+        assert isclose(result, expected, abs_tol=0.01)
+
+    @pytest.mark.parametrize('frozen_date', [_FEB_15_LEAP], indirect=True)
+    def test_february_leap_year(self, frozen_date):
         """Test calculation in February of leap year"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 2, 15, 12, 0, 0)  # Leap year
-            
-            with patch('utils.calculations.calendar') as mock_cal:
-                mock_cal.monthrange.return_value = (0, 29)  # February 2024 has 29 days
-                
-                result = calculate_realized_monthly_income(3000.0, 50.0)
-                
-                # Expected: (15 days / 29 days) * 3000 * 0.5 = 775.86
-                expected = (15 / 29) * 3000 * 0.5
-                assert abs(result - expected) < 0.01
+        result = calculate_realized_monthly_income(3000.0, 50.0)
+
+        # Expected: (15 days / 29 days) * 3000 * 0.5 = 775.86
+        expected = (15 / 29) * 3000 * 0.5
+        assert isclose(result, expected, abs_tol=0.01)
     
     def test_large_salary(self, frozen_time, mock_calendar):
         """Test with very large salary"""
         monthly_salary = 1000000.0
         goal_percentage = 90.0
-        
+
         result = calculate_realized_monthly_income(monthly_salary, goal_percentage)
-        
+
         expected = (15 / 31) * 1000000 * 0.9
-        assert abs(result - expected) < 1.0  # Allow for larger rounding with big numbers
+        assert isclose(result, expected, abs_tol=1.0)  # Allow for larger rounding with big numbers
+
+    @pytest.mark.parametrize('salary', [0, -1000])
+    def test_non_positive_salary(self, salary):
+        """Test that zero or negative salary yields no realized income"""
+        assert calculate_realized_income(salary) == 0
+
+
+class TestPotentialIncome:
+    """Test potential income (daily rate from salary and goal)"""
+
+    def test_basic_calculation(self, frozen_date):
+        """Test basic potential income calculation"""
+        result = calculate_potential_income(3000.0, 75.0)
+
+        # Expected: (3000/31) * 0.75 = 72.58
+        expected = (3000 / 31) * 0.75
+        assert isclose(result, expected, abs_tol=0.01)
+
+    @pytest.mark.parametrize('goal_percentage', [0, -10])
+    def test_non_positive_goal(self, goal_percentage):
+        """Test that zero or negative goal yields no potential income"""
+        assert calculate_potential_income(3000.0, goal_percentage) == 0
 
 
 class TestPotentialDailyIncome:
@@ -113,59 +149,55 @@ class TestPotentialDailyIncome:
         # Daily salary: 3000 / 31 = 96.77
         # Potential: 16 * 96.77 * 0.75 = 1161.29
         expected = (31 - 15) * (3000 / 31) * 0.75
-        assert abs(result - expected) < 0.01
+        assert isclose(result, expected, abs_tol=0.01)
     
-    def test_zero_salary(self, frozen_time, mock_calendar):
+    def test_zero_salary(self):
         """Test with zero salary"""
         result = calculate_potential_daily_income(0.0, 75.0)
         assert result == 0.0
     
-    def test_zero_goal_percentage(self, frozen_time, mock_calendar):
+    def test_zero_goal_percentage(self):
         """Test with zero goal percentage"""
         result = calculate_potential_daily_income(3000.0, 0.0)
         assert result == 0.0
     
-    def test_last_day_of_month(self, mock_calendar):
+    @pytest.mark.parametrize('frozen_date', [_JUL_31], indirect=True)
+    def test_last_day_of_month(self, frozen_date):
         """Test potential income on last day of month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 31, 12, 0, 0)
-            
-            result = calculate_potential_daily_income(3000.0, 75.0)
-            
-            # Days remaining: 31 - 31 = 0 days
-            assert result == 0.0
-    
-    def test_first_day_of_month(self, mock_calendar):
+        result = calculate_potential_daily_income(3000.0, 75.0)
+
+        # Days remaining: 31 - 31 = 0 days
+        assert result == 0.0
+
+    @pytest.mark.parametrize('frozen_date', [_JUL_1], indirect=True)
+    def test_first_day_of_month(self, frozen_date):
         """Test potential income on first day of month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 1, 12, 0, 0)
-            
-            result = calculate_potential_daily_income(3000.0, 50.0)
-            
-            # Days remaining: 31 - 1 = 30 days
-            # Daily salary: 3000 / 31 = 96.77
-            # Potential: 30 * 96.77 * 0.5 = 1451.61
-            expected = (31 - 1) * (3000 / 31) * 0.5
-            assert abs(result - expected) < 0.01
+        result = calculate_potential_daily_income(3000.0, 50.0)
+
+        # Days remaining: 31 - 1 = 30 days
+        # Daily salary: 3000 / 31 = 96.77
+        # Potential: 30 * 96.77 * 0.5 = 1451.61
+        expected = (31 - 1) * (3000 / 31) * 0.5
+        assert isclose(result, expected, abs_tol=0.01)
 
 
 class TestTotalAssets:
     """Test total assets calculation"""
     
-    def test_basic_calculation(self, sample_assets):
+    def test_basic_calculation(self):
         """Test basic assets calculation without currency conversion"""
-        result = calculate_total_assets(sample_assets)
+        result = calculate_total_assets(_SAMPLE_ASSETS)
         
         # Bank + EUR + USD (no conversion) + Investments
         # 5000 + 200 + 100 + 10000 = 15300
         expected = 5000.0 + 200.0 + 100.0 + 10000.0
         assert result == expected
     
-    def test_with_usd_conversion(self, sample_assets):
+    def test_with_usd_conversion(self):
         """Test assets calculation with USD to EUR conversion"""
         usd_to_eur_rate = 0.85
-        
-        result = calculate_total_assets(sample_assets, usd_to_eur_rate)
+
+        result = calculate_total_assets(_SAMPLE_ASSETS, usd_to_eur_rate)
         
         # Bank + EUR + USD*rate + Investments
         # 5000 + 200 + (100 * 0.85) + 10000 = 15285
@@ -174,14 +206,7 @@ class TestTotalAssets:
     
     def test_zero_assets(self):
         """Test with all zero assets"""
-        zero_assets = {
-            'bank_balance': 0.0,
-            'cash_eur': 0.0,
-            'cash_usd': 0.0,
-            'investments': 0.0
-        }
-        
-        result = calculate_total_assets(zero_assets)
+        result = calculate_total_assets(_ZERO_ASSETS)
         assert result == 0.0
     
     def test_negative_assets(self):
@@ -214,14 +239,14 @@ class TestTotalAssets:
 class TestGlobalPosition:
     """Test global position calculation"""
     
-    def test_complete_calculation(self, frozen_time, mock_calendar, sample_assets):
+    def test_complete_calculation(self, frozen_time, mock_calendar):
         """Test complete global position calculation"""
         monthly_salary = 3000.0
         goal_percentage = 75.0
         usd_to_eur_rate = 0.85
         
         result = calculate_global_position(
-            sample_assets, monthly_salary, goal_percentage, usd_to_eur_rate
+            _SAMPLE_ASSETS, monthly_salary, goal_percentage, usd_to_eur_rate
         )
         
         # Assets: 5000 + 200 + (100 * 0.85) + 10000 = 15285
@@ -234,26 +259,28 @@ class TestGlobalPosition:
         potential = (31 - 15) * (3000 / 31) * 0.75
         
         expected = assets + realized + potential
-        assert abs(result - expected) < 0.01
+        assert isclose(result, expected, abs_tol=0.01)
     
     def test_zero_everything(self):
         """Test with all zero values"""
-        zero_assets = {
-            'bank_balance': 0.0,
-            'cash_eur': 0.0,
-            'cash_usd': 0.0,
-            'investments': 0.0
-        }
-        
-        result = calculate_global_position(zero_assets, 0.0, 0.0)
+        result = calculate_global_position(_ZERO_ASSETS, 0.0, 0.0)
         assert result == 0.0
     
-    def test_without_usd_conversion(self, frozen_time, mock_calendar, sample_assets):
+    def test_with_precalculated_income(self):
+        """Test global position with pre-calculated income values"""
+        result = calculate_global_position(_SAMPLE_ASSETS, 1500.0, 500.0, 0.85)
+
+        # Total assets: 5000 + 200 + (100 * 0.85) + 10000 = 15285
+        # Global position: 15285 + 1500 + 500 = 17285
+        expected = 15285.0 + 1500.0 + 500.0
+        assert isclose(result, expected, abs_tol=0.01)
+
+    def test_without_usd_conversion(self, frozen_time, mock_calendar):
         """Test global position without USD conversion"""
         monthly_salary = 3000.0
         goal_percentage = 50.0
-        
-        result = calculate_global_position(sample_assets, monthly_salary, goal_percentage)
+
+        result = calculate_global_position(_SAMPLE_ASSETS, monthly_salary, goal_percentage)
         
         # Assets without conversion: 5000 + 200 + 100 + 10000 = 15300
         assets = 15300.0
@@ -265,7 +292,28 @@ class TestGlobalPosition:
         potential = (31 - 15) * (3000 / 31) * 0.5
         
         expected = assets + realized + potential
-        assert abs(result - expected) < 0.01
+        assert isclose(result, expected, abs_tol=0.01)
+
+    def test_named_variants_match_dispatcher(self, frozen_time, mock_calendar):
+        """Test that the explicit variants agree with the dispatching form"""
+        from_values = calculate_global_position_from_values(_SAMPLE_ASSETS, 1500.0, 500.0, 0.85)
+        assert from_values == calculate_global_position(_SAMPLE_ASSETS, 1500.0, 500.0, 0.85)
+
+        from_salary = calculate_global_position_from_salary(_SAMPLE_ASSETS, 3000.0, 75.0, 0.85)
+        assert from_salary == calculate_global_position(_SAMPLE_ASSETS, 3000.0, 75.0, 0.85)
+
+    def test_fused_computation_matches_components(self, frozen_date):
+        """Test that compute_financials agrees with the component functions"""
+        result = compute_financials(_SAMPLE_ASSETS, 3000.0, 75.0, exchange_rate=0.85)
+
+        assert result['exchange_rate'] == 0.85
+        assert result['realized_income'] == calculate_realized_monthly_income(3000.0, 75.0)
+        assert result['potential_income'] == calculate_potential_daily_income(3000.0, 75.0)
+        assert result['total_assets'] == result['asset_breakdown']['total']['value_eur']
+
+        expected_position = (result['total_assets'] + result['realized_income']
+                             + result['potential_income'])
+        assert isclose(result['global_position'], expected_position, abs_tol=0.01)
 
 
 class TestMonthlyProgress:
@@ -277,81 +325,83 @@ class TestMonthlyProgress:
         
         # July 15th of 31-day month
         expected = 15 / 31
-        assert abs(progress - expected) < 0.01
+        assert isclose(progress, expected, abs_tol=0.01)
     
-    def test_first_day_progress(self, mock_calendar):
+    @pytest.mark.parametrize('frozen_date', [_JUL_1], indirect=True)
+    def test_first_day_progress(self, frozen_date):
         """Test progress on first day"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 1, 12, 0, 0)
-            
-            progress = get_monthly_progress()
-            expected = 1 / 31
-            assert abs(progress - expected) < 0.01
-    
-    def test_last_day_progress(self, mock_calendar):
+        progress = get_monthly_progress()
+        expected = 1 / 31
+        assert isclose(progress, expected, abs_tol=0.01)
+
+    @pytest.mark.parametrize('frozen_date', [_JUL_31], indirect=True)
+    def test_last_day_progress(self, frozen_date):
         """Test progress on last day"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 7, 31, 12, 0, 0)
-            
-            progress = get_monthly_progress()
-            expected = 31 / 31
-            assert progress == 1.0
-    
-    def test_february_progress(self):
+        progress = get_monthly_progress()
+        assert progress == 1.0
+
+    @pytest.mark.parametrize('frozen_date', [_FEB_14_LEAP], indirect=True)
+    def test_february_progress(self, frozen_date):
         """Test progress in February"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 2, 14, 12, 0, 0)
-            
-            with patch('utils.calculations.calendar') as mock_cal:
-                mock_cal.monthrange.return_value = (0, 29)  # February 2024
-                
-                progress = get_monthly_progress()
-                expected = 14 / 29
-                assert abs(progress - expected) < 0.01
+        progress = get_monthly_progress()
+        expected = 14 / 29
+        assert isclose(progress, expected, abs_tol=0.01)
+
+    def test_progress_details(self, frozen_date):
+        """Test the full progress breakdown dict"""
+        result = calculate_monthly_progress()
+
+        assert result['current_day'] == 15
+        assert result['days_in_month'] == 31
+        assert result['remaining_days'] == 16
+        assert result['year'] == 2024
+        assert isclose(result['progress_percentage'], (15 / 31) * 100, abs_tol=0.1)
+
+    def test_progress_handles_exceptions(self, monkeypatch):
+        """Test monthly progress handles datetime exceptions"""
+        class _BrokenDatetime:
+            # Fail the first now() call; the fallback branch calls now()
+            # again to stamp the year on the defaults, which must succeed
+            calls = 0
+
+            @classmethod
+            def now(cls):
+                cls.calls += 1
+                if cls.calls == 1:
+                    raise Exception("Date error")
+                return datetime(2024, 7, 15)
+
+        monkeypatch.setattr('utils.calculations.datetime', _BrokenDatetime)
+        result = calculate_monthly_progress()
+
+        # Should return sensible defaults
+        assert result['current_day'] == 1
+        assert result['days_in_month'] == 30
+        assert result['progress_percentage'] == 0
 
 
 class TestValidatePercentage:
     """Test percentage validation"""
-    
-    def test_valid_percentages(self):
-        """Test valid percentage values"""
-        assert validate_percentage(0.0) is True
-        assert validate_percentage(50.0) is True
-        assert validate_percentage(100.0) is True
-        assert validate_percentage(75.5) is True
-    
-    def test_invalid_percentages(self):
-        """Test invalid percentage values"""
-        with pytest.raises(ValueError):
-            validate_percentage(-1.0)
-        
-        with pytest.raises(ValueError):
-            validate_percentage(101.0)
-        
-        with pytest.raises(ValueError):
-            validate_percentage(150.0)
-    
-    def test_edge_case_percentages(self):
-        """Test edge case percentage values"""
-        assert validate_percentage(0.0001) is True
-        assert validate_percentage(99.9999) is True
-        
-        with pytest.raises(ValueError):
-            validate_percentage(-0.0001)
-        
-        with pytest.raises(ValueError):
-            validate_percentage(100.0001)
-    
-    def test_non_numeric_percentages(self):
-        """Test non-numeric percentage values"""
-        with pytest.raises(TypeError):
-            validate_percentage("50")
-        
-        with pytest.raises(TypeError):
-            validate_percentage(None)
-        
-        with pytest.raises(TypeError):
-            validate_percentage([50.0])
+
+    @pytest.mark.parametrize('good', [0.0, 50.0, 100.0, 75.5, 0.0001, 99.9999])
+    def test_accepts_valid_percentages(self, good):
+        """Valid and edge-case percentage values pass"""
+        assert validate_percentage(good) is True
+
+    @pytest.mark.parametrize('bad,exc', [
+        (-1.0, ValueError),
+        (101.0, ValueError),
+        (150.0, ValueError),
+        (-0.0001, ValueError),
+        (100.0001, ValueError),
+        ("50", TypeError),
+        (None, TypeError),
+        ([50.0], TypeError),
+    ])
+    def test_rejects_invalid_percentages(self, bad, exc):
+        """Out-of-range values raise ValueError, non-numeric raise TypeError"""
+        with pytest.raises(exc):
+            validate_percentage(bad)
 
 
 class TestEdgeCases:
@@ -399,124 +449,109 @@ class TestEdgeCases:
         assert realized > 0
         assert potential > 0
     
-    def test_monthly_day_boundaries(self):
+    @pytest.mark.parametrize('frozen_date', [
+        (datetime(2024, 1, 15, 12, 0, 0), 31),   # January
+        (datetime(2024, 2, 14, 12, 0, 0), 28),   # February (non-leap)
+        _FEB_14_LEAP,                            # February (leap)
+        (datetime(2024, 4, 15, 12, 0, 0), 30),   # April
+        (datetime(2024, 12, 15, 12, 0, 0), 31),  # December
+    ], indirect=True)
+    def test_monthly_day_boundaries(self, frozen_date):
         """Test calculations across different month lengths"""
-        test_cases = [
-            (1, 31),   # January
-            (2, 28),   # February (non-leap)
-            (2, 29),   # February (leap)
-            (4, 30),   # April
-            (12, 31),  # December
-        ]
-        
-        for month, days in test_cases:
-            with patch('utils.calculations.datetime') as mock_datetime:
-                mock_datetime.now.return_value = datetime(2024, month, days // 2, 12, 0, 0)
-                
-                with patch('utils.calculations.calendar') as mock_cal:
-                    mock_cal.monthrange.return_value = (0, days)
-                    
-                    realized = calculate_realized_monthly_income(3000.0, 75.0)
-                    potential = calculate_potential_daily_income(3000.0, 75.0)
-                    
-                    assert realized >= 0
-                    assert potential >= 0
-    
-    def test_decimal_goal_percentages(self, frozen_time, mock_calendar):
+        realized = calculate_realized_monthly_income(3000.0, 75.0)
+        potential = calculate_potential_daily_income(3000.0, 75.0)
+
+        assert realized >= 0
+        assert potential >= 0
+
+    def test_functions_handle_exceptions(self):
+        """Test that functions handle invalid inputs gracefully"""
+        assert calculate_realized_income(None) == 0
+        assert calculate_potential_income(None, None) == 0
+        assert calculate_total_assets({}) == 0.0
+        assert calculate_global_position({}, None, None) == 0
+
+    @pytest.mark.parametrize('percentage', [0.1, 0.5, 12.345, 87.654321, 99.999])
+    def test_decimal_goal_percentages(self, frozen_time, mock_calendar, percentage):
         """Test with precise decimal goal percentages"""
-        test_percentages = [0.1, 0.5, 12.345, 87.654321, 99.999]
-        
-        for percentage in test_percentages:
-            realized = calculate_realized_monthly_income(3000.0, percentage)
-            potential = calculate_potential_daily_income(3000.0, percentage)
-            
-            assert realized >= 0
-            assert potential >= 0
-            
-            # Verify calculations are proportional to percentage
-            if percentage > 0:
-                assert realized > 0
-                assert potential > 0
+        realized = calculate_realized_monthly_income(3000.0, percentage)
+        potential = calculate_potential_daily_income(3000.0, percentage)
+
+        # Positive percentages should yield proportional positive income
+        assert realized > 0
+        assert potential > 0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A realistic user situation plus the ranges its results must land in"""
+    date: datetime
+    days: int
+    assets: MappingProxyType
+    salary: float
+    goal: float
+    rate: float
+    min_global_pos: float
+    progress_range: tuple
+    realized_min: float = None      # also implies realized > potential
+    potential_max: float = None
+    income_fraction_max: float = None  # income as a share of total assets
+
+
+_SCENARIOS = [
+    Scenario(  # Mid-career professional, mid-month
+        date=datetime(2024, 6, 15, 14, 0, 0), days=30,
+        assets=MappingProxyType({
+            'bank_balance': 12000.0, 'cash_eur': 500.0,
+            'cash_usd': 300.0, 'investments': 45000.0}),
+        salary=4500.0, goal=80.0, rate=0.92,
+        min_global_pos=50000, progress_range=(0.4, 0.6)),
+    Scenario(  # Entry-level worker, end of month
+        date=datetime(2024, 3, 28, 18, 0, 0), days=31,
+        assets=MappingProxyType({
+            'bank_balance': 2500.0, 'cash_eur': 150.0,
+            'cash_usd': 50.0, 'investments': 1000.0}),
+        salary=2200.0, goal=65.0, rate=None,
+        min_global_pos=3700, progress_range=(0.85, 1.0),
+        realized_min=1000, potential_max=300),
+    Scenario(  # High earner with significant assets
+        date=datetime(2024, 12, 10, 9, 0, 0), days=31,
+        assets=MappingProxyType({
+            'bank_balance': 50000.0, 'cash_eur': 2000.0,
+            'cash_usd': 5000.0, 'investments': 250000.0}),
+        salary=8000.0, goal=95.0, rate=0.88,
+        min_global_pos=300000, progress_range=(0.25, 0.45),
+        income_fraction_max=0.1),
+]
 
 
 class TestIntegrationScenarios:
     """Test realistic integration scenarios"""
-    
-    def test_realistic_user_scenario_1(self, mock_calendar):
-        """Test scenario: Mid-career professional, mid-month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 6, 15, 14, 0, 0)  # June 15
-            
-            with patch('utils.calculations.calendar') as mock_cal:
-                mock_cal.monthrange.return_value = (0, 30)  # June has 30 days
-                
-                assets = {
-                    'bank_balance': 12000.0,
-                    'cash_eur': 500.0,
-                    'cash_usd': 300.0,
-                    'investments': 45000.0
-                }
-                
-                monthly_salary = 4500.0
-                goal_percentage = 80.0
-                usd_rate = 0.92
-                
-                global_pos = calculate_global_position(assets, monthly_salary, goal_percentage, usd_rate)
-                progress = get_monthly_progress()
-                
-                # Verify realistic ranges
-                assert global_pos > 50000  # Should be substantial
-                assert 0.4 < progress < 0.6  # Mid-month
-    
-    def test_realistic_user_scenario_2(self, mock_calendar):
-        """Test scenario: Entry-level worker, end of month"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 3, 28, 18, 0, 0)  # March 28
-            
-            with patch('utils.calculations.calendar') as mock_cal:
-                mock_cal.monthrange.return_value = (0, 31)  # March has 31 days
-                
-                assets = {
-                    'bank_balance': 2500.0,
-                    'cash_eur': 150.0,
-                    'cash_usd': 50.0,
-                    'investments': 1000.0
-                }
-                
-                monthly_salary = 2200.0
-                goal_percentage = 65.0
-                
-                realized = calculate_realized_monthly_income(monthly_salary, goal_percentage)
-                potential = calculate_potential_daily_income(monthly_salary, goal_percentage)
-                
-                # Near end of month, realized should be much higher than potential
-                assert realized > potential
-                assert realized > 1000  # Most of month completed
-                assert potential < 300   # Few days remaining
-    
-    def test_realistic_user_scenario_3(self, mock_calendar):
-        """Test scenario: High earner with significant assets"""
-        with patch('utils.calculations.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 12, 10, 9, 0, 0)  # December 10
-            
-            with patch('utils.calculations.calendar') as mock_cal:
-                mock_cal.monthrange.return_value = (0, 31)  # December has 31 days
-                
-                assets = {
-                    'bank_balance': 50000.0,
-                    'cash_eur': 2000.0,
-                    'cash_usd': 5000.0,
-                    'investments': 250000.0
-                }
-                
-                monthly_salary = 8000.0
-                goal_percentage = 95.0
-                usd_rate = 0.88
-                
-                total_assets = calculate_total_assets(assets, usd_rate)
-                global_pos = calculate_global_position(assets, monthly_salary, goal_percentage, usd_rate)
-                
-                # Assets should dominate the calculation
-                assert total_assets > 300000
-                assert global_pos > total_assets  # Income adds to position
-                assert (global_pos - total_assets) < total_assets * 0.1  # But income is smaller proportion 
\ No newline at end of file
+
+    @pytest.mark.parametrize('scenario,frozen_date',
+                             [(s, (s.date, s.days)) for s in _SCENARIOS],
+                             indirect=['frozen_date'],
+                             ids=['midcareer', 'entrylevel', 'highearner'])
+    def test_realistic_scenario(self, scenario, frozen_date):
+        """Each scenario's results must land in its realistic ranges"""
+        total_assets = calculate_total_assets(scenario.assets, scenario.rate)
+        global_pos = calculate_global_position(
+            scenario.assets, scenario.salary, scenario.goal, scenario.rate)
+        progress = get_monthly_progress()
+
+        assert global_pos >= scenario.min_global_pos
+        assert global_pos > total_assets  # Income always adds to position
+        low, high = scenario.progress_range
+        assert low < progress <= high
+
+        realized = calculate_realized_monthly_income(scenario.salary, scenario.goal)
+        potential = calculate_potential_daily_income(scenario.salary, scenario.goal)
+        if scenario.realized_min is not None:
+            # Near end of month, realized dwarfs what is left to earn
+            assert realized > scenario.realized_min
+            assert realized > potential
+        if scenario.potential_max is not None:
+            assert potential < scenario.potential_max
+        if scenario.income_fraction_max is not None:
+            # Assets dominate; income is a small share of the position
+            assert (global_pos - total_assets) < total_assets * scenario.income_fraction_max 
\ No newline at end of file
@@ -8,9 +8,9 @@ import json
 import os
 import tempfile
 import requests
-from datetime import datetime, timedelta
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, MagicMock
 
+from tests.helpers import CURRENCY_NOW_ISO
 from utils.currency import (
     get_exchange_rate, get_cached_rate, cache_rate,
     fetch_rate_from_api, FALLBACK_RATE, get_rate_info, convert_usd_to_eur
@@ -42,21 +42,12 @@ class TestCacheOperations:
             # Should not raise exception, just fail silently
             cache_rate(0.85)
     
-    def test_get_cached_rate_success(self, temp_data_dir):
+    def test_get_cached_rate_success(self, write_cache, frozen_currency_time):
         """Test successful rate loading from cache"""
-        # Create cache file
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': datetime.now().isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        cache_data = write_cache(rate=0.8542, minutes_ago=0)
+
         loaded_rate = get_cached_rate()
-        
+
         assert loaded_rate == cache_data['rate']
     
     def test_get_cached_rate_missing_file(self, temp_data_dir):
@@ -73,10 +64,10 @@ class TestCacheOperations:
         result = get_cached_rate()
         assert result is None
     
-    def test_get_cached_rate_missing_fields(self, temp_data_dir):
+    def test_get_cached_rate_missing_fields(self, temp_data_dir, frozen_currency_time):
         """Test loading from cache with missing required fields"""
         cache_data = {
-            'timestamp': datetime.now().isoformat()
+            'timestamp': CURRENCY_NOW_ISO
             # Missing 'rate' field
         }
         
@@ -91,51 +82,28 @@ class TestCacheOperations:
 class TestCacheValidation:
     """Test cache validity checking"""
     
-    def test_cache_valid_fresh_cache(self, temp_data_dir):
+    def test_cache_valid_fresh_cache(self, write_cache, frozen_currency_time):
         """Test cache validation with fresh data"""
         # Create fresh cache (5 minutes ago)
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': (datetime.now() - timedelta(minutes=5)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        write_cache(minutes_ago=5)
+
         # Fresh cache should return a rate (not None)
         assert get_cached_rate() is not None
     
-    def test_cache_invalid_expired_cache(self, temp_data_dir):
+    def test_cache_invalid_expired_cache(self, write_cache, frozen_currency_time):
         """Test cache validation with expired data"""
         # Create expired cache (2 hours ago)
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': (datetime.now() - timedelta(hours=2)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        write_cache(minutes_ago=120)
+
         # Expired cache should return None
         assert get_cached_rate() is None
     
-    def test_cache_edge_case_exactly_one_hour(self, temp_data_dir):
+    def test_cache_edge_case_exactly_one_hour(self, write_cache, frozen_currency_time):
         """Test cache validation at exactly one hour boundary"""
-        # Create cache exactly 1 hour ago
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': (datetime.now() - timedelta(hours=1)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        # Create cache exactly 1 hour ago; with the clock frozen this sits
+        # precisely on the expiry boundary instead of epsilon past it
+        write_cache(minutes_ago=60)
+
         # Should be invalid (>= 1 hour is expired) - returns None
         assert get_cached_rate() is None
     
@@ -153,182 +121,143 @@ class TestCacheValidation:
         # Corrupted cache should return None
         assert get_cached_rate() is None
     
-    def test_cache_invalid_timestamp(self, temp_data_dir):
+    def test_cache_invalid_timestamp(self, write_cache):
         """Test cache validation with invalid timestamp format"""
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': 'invalid-timestamp-format',
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        write_cache(timestamp='invalid-timestamp-format')
+
         # Invalid timestamp should return None
         assert get_cached_rate() is None
 
 
 class TestAPIFetching:
     """Test exchange rate API fetching"""
-    
-    def test_fetch_rate_from_api_success(self, mock_exchange_api):
+
+    @pytest.fixture(autouse=True)
+    def _mock_requests_get(self, monkeypatch):
+        """Install one session.get mock for the whole class; tests just
+        configure side_effect/return_value instead of opening a patch
+        context each."""
+        self.mock_get = MagicMock()
+        monkeypatch.setattr('utils.currency._session.get', self.mock_get)
+
+    def test_fetch_rate_from_api_success(self, make_response):
         """Test successful API rate fetching"""
+        self.mock_get.return_value = make_response({'rates': {'EUR': 0.8542}})
+
         rate = fetch_rate_from_api()
-        
+
         assert rate == 0.8542
-        mock_exchange_api.assert_called_once()
-        
+        assert self.mock_get.call_count == 1
+
         # Verify correct API endpoint was called
-        args, kwargs = mock_exchange_api.call_args
+        args, kwargs = self.mock_get.call_args
         assert 'https://api.exchangerate-api.com/v4/latest/USD' in args[0]
-    
+
     def test_fetch_rate_from_api_network_error(self):
         """Test API fetching with network error"""
-        with patch('requests.get', side_effect=requests.RequestException("Network error")):
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
+        self.mock_get.side_effect = requests.RequestException("Network error")
+        rate = fetch_rate_from_api()
+        assert rate is None
+
     def test_fetch_rate_from_api_timeout(self):
         """Test API fetching with timeout"""
-        with patch('requests.get', side_effect=requests.Timeout("Request timeout")):
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
-    def test_fetch_rate_from_api_http_error(self):
+        self.mock_get.side_effect = requests.Timeout("Request timeout")
+        rate = fetch_rate_from_api()
+        assert rate is None
+
+    def test_fetch_rate_from_api_http_error(self, make_response):
         """Test API fetching with HTTP error status"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-            mock_get.return_value = mock_response
-            
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
-    def test_fetch_rate_from_api_invalid_response_structure(self):
+        self.mock_get.return_value = make_response(
+            http_error=requests.HTTPError("404 Not Found"))
+
+        rate = fetch_rate_from_api()
+        assert rate is None
+
+    def test_fetch_rate_from_api_invalid_response_structure(self, make_response):
         """Test API fetching with invalid response structure"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                'invalid': 'structure'
-                # Missing 'rates' field
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
-    def test_fetch_rate_from_api_missing_eur_rate(self):
+        # Missing 'rates' field
+        self.mock_get.return_value = make_response({'invalid': 'structure'})
+
+        rate = fetch_rate_from_api()
+        assert rate is None
+
+    def test_fetch_rate_from_api_missing_eur_rate(self, make_response):
         """Test API fetching when EUR rate is missing"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                'rates': {
-                    'GBP': 0.7583,
-                    'JPY': 110.0
-                    # Missing 'EUR'
-                }
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
-    def test_fetch_rate_from_api_json_decode_error(self):
+        # Missing 'EUR'
+        self.mock_get.return_value = make_response(
+            {'rates': {'GBP': 0.7583, 'JPY': 110.0}})
+
+        rate = fetch_rate_from_api()
+        assert rate is None
+
+    def test_fetch_rate_from_api_json_decode_error(self, make_response):
         """Test API fetching with JSON decode error"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            rate = fetch_rate_from_api()
-            assert rate is None
-    
+        self.mock_get.return_value = make_response(
+            json_error=json.JSONDecodeError("Invalid JSON", "", 0))
+
+        rate = fetch_rate_from_api()
+        assert rate is None
+
     def test_fetch_rate_from_api_unexpected_exception(self):
         """Test API fetching with unexpected exception"""
-        with patch('requests.get', side_effect=Exception("Unexpected error")):
-            rate = fetch_rate_from_api()
-            assert rate is None
+        self.mock_get.side_effect = Exception("Unexpected error")
+        rate = fetch_rate_from_api()
+        assert rate is None
 
 
 class TestMainFunction:
     """Test main get_exchange_rate function"""
     
-    def test_get_rate_with_valid_cache(self, temp_data_dir):
+    def test_get_rate_with_valid_cache(self, write_cache, frozen_currency_time,
+                                       mock_fetch_rate):
         """Test getting rate when cache is valid"""
         # Create valid cache
-        cache_data = {
-            'rate': 0.8542,
-            'timestamp': (datetime.now() - timedelta(minutes=30)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
-        with patch('utils.currency.fetch_rate_from_api') as mock_api:
-            rate = get_exchange_rate()
-            
-            assert rate == 0.8542
-            # API should not be called when cache is valid
-            mock_api.assert_not_called()
+        write_cache(rate=0.8542, minutes_ago=30)
+
+        rate = get_exchange_rate()
+
+        assert rate == 0.8542
+        # API should not be called when cache is valid
+        assert mock_fetch_rate.call_count == 0
     
-    def test_get_rate_with_expired_cache_api_success(self, temp_data_dir, mock_exchange_api):
+    def test_get_rate_with_expired_cache_api_success(self, write_cache, mock_exchange_api,
+                                                     frozen_currency_time):
         """Test getting rate when cache is expired but API succeeds"""
-        # Create expired cache
-        cache_data = {
-            'rate': 0.8000,  # Old rate
-            'timestamp': (datetime.now() - timedelta(hours=2)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        # Create expired cache holding an old rate
+        write_cache(rate=0.8000, minutes_ago=120)
+
         rate = get_exchange_rate()
         
         # Should get new rate from API
         assert rate == 0.8542
-        mock_exchange_api.assert_called_once()
+        assert mock_exchange_api.call_count == 1
     
-    def test_get_rate_with_expired_cache_api_failure(self, temp_data_dir):
+    def test_get_rate_with_expired_cache_api_failure(self, write_cache, frozen_currency_time,
+                                                     mock_fetch_rate):
         """Test getting rate when cache is expired and API fails"""
         # Create expired cache
-        cache_data = {
-            'rate': 0.8000,
-            'timestamp': (datetime.now() - timedelta(hours=2)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            
-            # Should fall back to fallback rate when cache expired and API fails
-            assert rate == FALLBACK_RATE
+        write_cache(rate=0.8000, minutes_ago=120)
+
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+
+        # Should fall back to fallback rate when cache expired and API fails
+        assert rate == FALLBACK_RATE
     
     def test_get_rate_no_cache_api_success(self, temp_data_dir, mock_exchange_api):
         """Test getting rate when no cache exists and API succeeds"""
         rate = get_exchange_rate()
         
         assert rate == 0.8542
-        mock_exchange_api.assert_called_once()
+        assert mock_exchange_api.call_count == 1
     
-    def test_get_rate_no_cache_api_failure(self, temp_data_dir):
+    def test_get_rate_no_cache_api_failure(self, temp_data_dir, mock_fetch_rate):
         """Test getting rate when no cache exists and API fails"""
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            
-            # Should return fallback rate
-            assert rate == FALLBACK_RATE
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+
+        # Should return fallback rate
+        assert rate == FALLBACK_RATE
     
     def test_get_rate_cache_corruption_api_success(self, temp_data_dir, mock_exchange_api):
         """Test getting rate when cache is corrupted but API succeeds"""
@@ -340,146 +269,102 @@ class TestMainFunction:
         rate = get_exchange_rate()
         
         assert rate == 0.8542
-        mock_exchange_api.assert_called_once()
+        assert mock_exchange_api.call_count == 1
     
-    def test_get_rate_cache_corruption_api_failure(self, temp_data_dir):
+    def test_get_rate_cache_corruption_api_failure(self, temp_data_dir, mock_fetch_rate):
         """Test getting rate when cache is corrupted and API fails"""
         # Create corrupted cache
         cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
         with open(cache_path, 'w') as f:
             f.write('{"corrupted": json}')
-        
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            
-            # Should return fallback rate
-            assert rate == FALLBACK_RATE
+
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+
+        # Should return fallback rate
+        assert rate == FALLBACK_RATE
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions"""
     
-    def test_extreme_exchange_rates(self, temp_data_dir):
+    @pytest.mark.parametrize('test_rate', [0.0001, 999999.0, 0.5, 2.0])
+    def test_extreme_exchange_rates(self, temp_data_dir, mock_fetch_rate, test_rate):
         """Test with extreme exchange rate values"""
-        extreme_rates = [0.0001, 999999.0, 0.5, 2.0]
-        
-        for test_rate in extreme_rates:
-            # Clear cache before each iteration to ensure fresh API call
-            cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-            if os.path.exists(cache_path):
-                os.remove(cache_path)
-                
-            with patch('utils.currency.fetch_rate_from_api', return_value=test_rate):
-                rate = get_exchange_rate()
-                assert rate == test_rate
+        # Each parametrization gets its own temp_data_dir, so there is no
+        # stale cache to clear before the API call
+        mock_fetch_rate.return_value = test_rate
+        rate = get_exchange_rate()
+        assert rate == test_rate
     
-    def test_zero_exchange_rate(self, temp_data_dir):
+    def test_zero_exchange_rate(self, temp_data_dir, mock_fetch_rate):
         """Test with zero exchange rate from API"""
-        with patch('utils.currency.fetch_rate_from_api', return_value=0.0):
-            rate = get_exchange_rate()
-            # Zero rate should be considered valid (though unrealistic)
-            assert rate == 0.0
+        mock_fetch_rate.return_value = 0.0
+        rate = get_exchange_rate()
+        # Zero rate should be considered valid (though unrealistic)
+        assert rate == 0.0
     
-    def test_negative_exchange_rate(self, temp_data_dir):
+    def test_negative_exchange_rate(self, temp_data_dir, mock_fetch_rate):
         """Test with negative exchange rate from API"""
-        with patch('utils.currency.fetch_rate_from_api', return_value=-0.5):
-            rate = get_exchange_rate()
-            # Negative rate should be considered valid by the module
-            assert rate == -0.5
+        mock_fetch_rate.return_value = -0.5
+        rate = get_exchange_rate()
+        # Negative rate should be considered valid by the module
+        assert rate == -0.5
     
-    def test_very_old_cache(self, temp_data_dir):
+    def test_very_old_cache(self, write_cache, frozen_currency_time, mock_fetch_rate):
         """Test with very old cache data"""
         # Create cache from last year
-        cache_data = {
-            'rate': 0.7500,
-            'timestamp': (datetime.now() - timedelta(days=365)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            
-            # Should return fallback rate when very old cache and API fails
-            assert rate == FALLBACK_RATE
+        write_cache(rate=0.7500, minutes_ago=365 * 24 * 60)
+
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+
+        # Should return fallback rate when very old cache and API fails
+        assert rate == FALLBACK_RATE
     
-    def test_future_timestamp_cache(self, temp_data_dir):
+    def test_future_timestamp_cache(self, write_cache, frozen_currency_time, mock_fetch_rate):
         """Test with cache that has future timestamp"""
-        # Create cache with future timestamp
-        cache_data = {
-            'rate': 0.8800,
-            'timestamp': (datetime.now() + timedelta(hours=1)).isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
+        # Create cache stamped one hour in the future
+        write_cache(rate=0.8800, minutes_ago=-60)
+
         # Future timestamp should be considered valid - cache should return the rate
         assert get_cached_rate() is not None
-        
-        with patch('utils.currency.fetch_rate_from_api') as mock_api:
-            rate = get_exchange_rate()
-            
-            assert rate == 0.8800
-            mock_api.assert_not_called()
+
+        rate = get_exchange_rate()
+
+        assert rate == 0.8800
+        assert mock_fetch_rate.call_count == 0
 
 
 class TestConcurrency:
     """Test concurrent access and file locking scenarios"""
     
-    def test_simultaneous_cache_write(self, temp_data_dir):
+    def test_simultaneous_cache_write(self, temp_data_dir, executor):
         """Test behavior when cache is written simultaneously"""
-        # This tests the resilience of the caching mechanism
-        # when multiple processes might be writing at the same time
-        
-        def write_cache():
-            cache_rate(0.8500)
-        
-        # Simulate concurrent writes
-        import threading
-        threads = []
-        for i in range(5):
-            t = threading.Thread(target=write_cache)
-            threads.append(t)
-            t.start()
-        
-        for t in threads:
-            t.join()
-        
+        # This tests the resilience of the caching mechanism when multiple
+        # processes might be writing at the same time. The session-scoped
+        # pool runs the writes concurrently without spawning fresh threads.
+        list(executor.map(lambda _: cache_rate(0.8500), range(5)))
+
         # Should have a valid cache file after all writes
         rate = get_cached_rate()
         assert rate == 0.8500
     
-    def test_cache_read_during_write(self, temp_data_dir):
+    def test_cache_read_during_write(self, temp_data_dir, frozen_currency_time):
         """Test reading cache while it's being written"""
-        import threading
-        import time
-        
-        def slow_write():
-            # Simulate slow write operation
-            cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-            with open(cache_path, 'w') as f:
-                f.write('{"rate": 0.8')
-                time.sleep(0.1)  # Delay to simulate incomplete write
-                f.write('500, "timestamp": "' + datetime.now().isoformat() + '", "source": "api"}')
-        
-        write_thread = threading.Thread(target=slow_write)
-        write_thread.start()
-        
-        time.sleep(0.05)  # Start reading while write is in progress
-        
-        # Should handle incomplete file gracefully
-        rate = get_cached_rate()
-        # Might be None due to incomplete JSON, which is acceptable
-        
-        write_thread.join()
-        
-        # After write completes, should be able to read
+        # Stage the partial-write state deterministically instead of racing
+        # a sleeping writer thread against the reader
+        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
+        with open(cache_path, 'w') as f:
+            f.write('{"rate": 0.8')
+
+        # Should handle incomplete file gracefully (malformed JSON)
+        assert get_cached_rate() is None
+
+        # Complete the write; the cache becomes readable
+        with open(cache_path, 'a') as f:
+            f.write('500, "timestamp": "' + CURRENCY_NOW_ISO + '", "source": "api"}')
+
         rate = get_cached_rate()
         assert rate == 0.8500
 
@@ -493,54 +378,43 @@ class TestFallbackBehavior:
         assert 0.5 <= FALLBACK_RATE <= 1.5
         assert isinstance(FALLBACK_RATE, float)
     
-    def test_fallback_used_when_all_fails(self, temp_data_dir):
+    def test_fallback_used_when_all_fails(self, temp_data_dir, mock_fetch_rate):
         """Test fallback is used when both cache and API fail"""
-        # No cache file exists
-        # API returns None
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            assert rate == FALLBACK_RATE
+        # No cache file exists; API returns None
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+        assert rate == FALLBACK_RATE
     
-    def test_fallback_not_used_when_cache_available(self, temp_data_dir):
+    def test_fallback_not_used_when_cache_available(self, write_cache, frozen_currency_time,
+                                                    mock_fetch_rate):
         """Test fallback is not used when cache is available"""
         # Create valid cache
-        cache_data = {
-            'rate': 0.9000,
-            'timestamp': datetime.now().isoformat(),
-            'source': 'api'
-        }
-        
-        cache_path = os.path.join(temp_data_dir, 'exchange_rates.json')
-        with open(cache_path, 'w') as f:
-            json.dump(cache_data, f)
-        
-        with patch('utils.currency.fetch_rate_from_api', return_value=None):
-            rate = get_exchange_rate()
-            # Should use cache, not fallback
-            assert rate == 0.9000
-            assert rate != FALLBACK_RATE
+        write_cache(rate=0.9000, minutes_ago=0)
+
+        mock_fetch_rate.return_value = None
+        rate = get_exchange_rate()
+        # Should use cache, not fallback
+        assert rate == 0.9000
+        assert rate != FALLBACK_RATE
 
 
 class TestAPITimeout:
     """Test API timeout behavior"""
     
-    def test_api_request_has_timeout(self):
+    def test_api_request_has_timeout(self, monkeypatch, make_response):
         """Test that API requests include timeout"""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {'rates': {'EUR': 0.85}}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
-            
-            fetch_rate_from_api()
-            
-            # Verify timeout was specified
-            args, kwargs = mock_get.call_args
-            assert 'timeout' in kwargs
-            assert kwargs['timeout'] == 5  # Should be 5 seconds
+        mock_get = MagicMock(return_value=make_response({'rates': {'EUR': 0.85}}))
+        monkeypatch.setattr('utils.currency._session.get', mock_get)
+
+        fetch_rate_from_api()
+
+        # Verify timeout was specified
+        args, kwargs = mock_get.call_args
+        assert 'timeout' in kwargs
+        assert kwargs['timeout'] == 5  # Should be 5 seconds
     
     def test_api_timeout_behavior(self):
         """Test behavior when API times out"""
-        with patch('requests.get', side_effect=requests.Timeout("Request timed out")):
+        with patch('utils.currency._session.get', side_effect=requests.Timeout("Request timed out")):
             rate = fetch_rate_from_api()
             assert rate is None 
\ No newline at end of file
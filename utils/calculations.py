@@ -1,83 +1,128 @@
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import calendar
 from utils.currency import get_exchange_rate
 
-def calculate_realized_income(monthly_salary):
+@lru_cache(maxsize=64)
+def _days_in_month(year, month):
+    """Month length is pure per (year, month); cache it so back-to-back
+    dashboard calculations don't re-run calendar's day math"""
+    return calendar.monthrange(year, month)[1]
+
+@lru_cache(maxsize=128)
+def _realized_income(monthly_salary, current_day, days_in_month):
+    """Pure day-proration math, memoized: real traffic hits a handful of
+    (salary, day) pairs between config changes"""
+    return round((current_day / days_in_month) * monthly_salary, 2)
+
+@lru_cache(maxsize=128)
+def _potential_income(monthly_salary, goal_percentage, days_in_month):
+    """Pure daily-potential math, memoized like _realized_income"""
+    daily_income = monthly_salary / days_in_month
+    return round(daily_income * (goal_percentage / 100), 2)
+
+def calculate_realized_income(monthly_salary, now=None):
     """
     Calculate income based on days passed in the current month
     Formula: (Current Day / Days in Month) × Monthly Salary
     """
     if not monthly_salary or monthly_salary <= 0:
         return 0
-    
+
     try:
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_day = now.day
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
-        
-        realized_income = (current_day / days_in_month) * monthly_salary
-        return round(realized_income, 2)
-    
-    except Exception as e:
+        days_in_month = _days_in_month(now.year, now.month)
+
+        return _realized_income(float(monthly_salary), current_day, days_in_month)
+
+    except Exception:
         return 0
 
-def calculate_potential_income(monthly_salary, goal_percentage):
+def calculate_potential_income(monthly_salary, goal_percentage, now=None):
     """
     Calculate today's potential income based on goal completion
     Formula: (Monthly Salary / Days in Month) × Goal Completion %
     """
     if not monthly_salary or monthly_salary <= 0 or goal_percentage < 0:
         return 0
-    
+
     try:
-        now = datetime.now()
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
-        
-        daily_income = monthly_salary / days_in_month
-        potential_income = daily_income * (goal_percentage / 100)
-        
-        return round(potential_income, 2)
-    
-    except Exception as e:
+        if now is None:
+            now = datetime.now()
+        days_in_month = _days_in_month(now.year, now.month)
+
+        return _potential_income(float(monthly_salary), float(goal_percentage), days_in_month)
+
+    except Exception:
         return 0
 
+def _total_assets_kernel(bank_balance, cash_eur, cash_usd, investments, exchange_rate=None):
+    """
+    Sum the four asset components in EUR using plain float arithmetic.
+    Only converts USD if an exchange rate is explicitly provided.
+    """
+    if exchange_rate is not None:
+        cash_usd = cash_usd * exchange_rate
+    return bank_balance + cash_eur + cash_usd + investments
+
+_ASSET_DEFAULTS = {'bank_balance': 0, 'cash_eur': 0, 'cash_usd': 0, 'investments': 0}
+_asset_values = itemgetter('bank_balance', 'cash_eur', 'cash_usd', 'investments')
+
 def calculate_total_assets(assets, exchange_rate=None):
     """Calculate total assets value in EUR"""
+    # One C-level itemgetter unpack replaces four dict.get calls; merging
+    # over the defaults supplies zeros for any missing fields
+    bank_balance, cash_eur, cash_usd, investments = _asset_values({**_ASSET_DEFAULTS, **assets})
     try:
-        # Only convert USD if exchange rate is explicitly provided
-        if exchange_rate is not None:
-            # Convert USD cash to EUR using provided rate
-            cash_usd_in_eur = assets.get('cash_usd', 0) * exchange_rate
-        else:
-            # No conversion - treat USD as EUR (1:1)
-            cash_usd_in_eur = assets.get('cash_usd', 0)
-        
-        total_assets = (
-            assets.get('bank_balance', 0) +
-            assets.get('cash_eur', 0) +
-            cash_usd_in_eur +
-            assets.get('investments', 0)
-        )
-        
+        total_assets = _total_assets_kernel(bank_balance, cash_eur, cash_usd, investments, exchange_rate)
         return round(total_assets, 2)
-    
-    except Exception as e:
-        # Fallback calculation without currency conversion
-        total_assets = (
-            assets.get('bank_balance', 0) +
-            assets.get('cash_eur', 0) +
-            assets.get('cash_usd', 0) +  # Treat USD as EUR in fallback
-            assets.get('investments', 0)
-        )
+
+    except (TypeError, ValueError):
+        # Fallback calculation without currency conversion (USD treated as
+        # EUR). get_exchange_rate handles its own failures and never
+        # raises, so only bad operand types can land here.
+        total_assets = _total_assets_kernel(bank_balance, cash_eur, cash_usd, investments)
         return round(total_assets, 2)
 
+def calculate_global_position_from_values(assets, realized_income, potential_income, exchange_rate=None):
+    """
+    Calculate total financial position from pre-calculated income figures.
+
+    The straight-line variant for callers that already hold the realized
+    and potential income — no argument sniffing, just the asset sum and
+    an addition.
+    """
+    try:
+        total_assets = calculate_total_assets(assets, exchange_rate)
+        return round(total_assets + realized_income + potential_income, 2)
+
+    except Exception:
+        return 0
+
+def calculate_global_position_from_salary(assets, monthly_salary, goal_percentage, exchange_rate=None, now=None):
+    """Calculate total financial position from salary and goal percentage"""
+    try:
+        total_assets = calculate_total_assets(assets, exchange_rate)
+        realized_income = calculate_realized_monthly_income(monthly_salary or 0, goal_percentage or 0, now=now)
+        potential_income = calculate_potential_daily_income(monthly_salary or 0, goal_percentage or 0, now=now)
+        return round(total_assets + realized_income + potential_income, 2)
+
+    except Exception:
+        return 0
+
 def calculate_global_position(assets, realized_income_or_salary, potential_income_or_goal_percentage, exchange_rate=None):
     """
     Calculate total financial position including assets and income
-    
+
     Can be called in two ways:
     1. calculate_global_position(assets, realized_income, potential_income) - with pre-calculated values
     2. calculate_global_position(assets, monthly_salary, goal_percentage, exchange_rate) - calculate internally
+
+    Kept for compatibility; the argument sniffing runs per call, so new
+    code should call one of the explicit variants above directly.
     """
     try:
         # Determine if we're getting pre-calculated values or need to calculate
@@ -85,86 +130,126 @@ def calculate_global_position(assets, realized_income_or_salary, potential_incom
             # Check if second parameter looks like a percentage (0-100)
             # If so, treat as salary and goal percentage
             if 0 <= potential_income_or_goal_percentage <= 100:
-                # Assume these are salary and goal percentage
-                total_assets = calculate_total_assets(assets, exchange_rate)
-                realized_income = calculate_realized_monthly_income(realized_income_or_salary, potential_income_or_goal_percentage)
-                potential_income = calculate_potential_daily_income(realized_income_or_salary, potential_income_or_goal_percentage)
-            else:
-                # Assume these are pre-calculated income values
-                total_assets = calculate_total_assets(assets, exchange_rate)
-                realized_income = realized_income_or_salary
-                potential_income = potential_income_or_goal_percentage
-        else:
-            # Handle as salary and goal percentage
-            total_assets = calculate_total_assets(assets, exchange_rate)
-            realized_income = calculate_realized_monthly_income(realized_income_or_salary or 0, potential_income_or_goal_percentage or 0)
-            potential_income = calculate_potential_daily_income(realized_income_or_salary or 0, potential_income_or_goal_percentage or 0)
-        
-        global_position = total_assets + realized_income + potential_income
-        
-        return round(global_position, 2)
-    
-    except Exception as e:
+                return calculate_global_position_from_salary(
+                    assets, realized_income_or_salary, potential_income_or_goal_percentage, exchange_rate)
+            # Assume these are pre-calculated income values
+            return calculate_global_position_from_values(
+                assets, realized_income_or_salary, potential_income_or_goal_percentage, exchange_rate)
+
+        # Handle as salary and goal percentage
+        return calculate_global_position_from_salary(
+            assets, realized_income_or_salary, potential_income_or_goal_percentage, exchange_rate)
+
+    except Exception:
         return 0
 
-def get_asset_breakdown(assets):
-    """Get detailed breakdown of assets with EUR conversion"""
+# (field, display currency, needs USD→EUR conversion) — adding an asset
+# class is one schema row instead of several hand-unrolled dict entries
+_ASSET_SCHEMA = (
+    ('bank_balance', 'EUR', False),
+    ('cash_eur', 'EUR', False),
+    ('cash_usd', 'USD', True),
+    ('investments', 'EUR', False),
+)
+
+def get_asset_breakdown(assets, exchange_rate=None):
+    """
+    Get detailed breakdown of assets with EUR conversion.
+
+    Callers that already hold a rate for the current request can pass it
+    in to avoid a second get_exchange_rate() lookup.
+    """
     try:
-        exchange_rate = get_exchange_rate()
-        
-        breakdown = {
-            'bank_balance': {
-                'value': assets.get('bank_balance', 0),
-                'currency': 'EUR',
-                'value_eur': assets.get('bank_balance', 0)
-            },
-            'cash_eur': {
-                'value': assets.get('cash_eur', 0),
-                'currency': 'EUR',
-                'value_eur': assets.get('cash_eur', 0)
-            },
-            'cash_usd': {
-                'value': assets.get('cash_usd', 0),
-                'currency': 'USD',
-                'value_eur': round(assets.get('cash_usd', 0) * exchange_rate, 2),
-                'exchange_rate': exchange_rate
-            },
-            'investments': {
-                'value': assets.get('investments', 0),
-                'currency': 'EUR',
-                'value_eur': assets.get('investments', 0)
-            }
-        }
-        
-        # Calculate total
-        total_eur = sum(item['value_eur'] for item in breakdown.values())
+        if exchange_rate is None:
+            exchange_rate = get_exchange_rate()
+
+        # One merge over the defaults replaces a bound-method .get call per
+        # field with plain C-level indexing (same trick as
+        # calculate_total_assets)
+        merged = {**_ASSET_DEFAULTS, **assets}
+
+        breakdown = {}
+        total_eur = 0.0
+        for field, currency, needs_conversion in _ASSET_SCHEMA:
+            value = merged[field]
+            if needs_conversion:
+                entry = {
+                    'value': value,
+                    'currency': currency,
+                    'value_eur': round(value * exchange_rate, 2),
+                    'exchange_rate': exchange_rate
+                }
+            else:
+                entry = {'value': value, 'currency': currency, 'value_eur': value}
+            total_eur += entry['value_eur']
+            breakdown[field] = entry
+
         breakdown['total'] = {
             'value_eur': round(total_eur, 2),
             'currency': 'EUR'
         }
-        
+
         return breakdown
-    
-    except Exception as e:
-        # Fallback breakdown
-        return {
-            'bank_balance': {'value': assets.get('bank_balance', 0), 'currency': 'EUR', 'value_eur': assets.get('bank_balance', 0)},
-            'cash_eur': {'value': assets.get('cash_eur', 0), 'currency': 'EUR', 'value_eur': assets.get('cash_eur', 0)},
-            'cash_usd': {'value': assets.get('cash_usd', 0), 'currency': 'USD', 'value_eur': assets.get('cash_usd', 0)},
-            'investments': {'value': assets.get('investments', 0), 'currency': 'EUR', 'value_eur': assets.get('investments', 0)},
-            'total': {'value_eur': sum(assets.get(key, 0) for key in ['bank_balance', 'cash_eur', 'cash_usd', 'investments']), 'currency': 'EUR'}
-        }
 
-def get_income_breakdown(monthly_salary, goal_percentage):
+    except (TypeError, ValueError, AttributeError):
+        # Fallback breakdown (USD treated as EUR, no conversion).
+        # get_exchange_rate returns its fallback rate rather than raising,
+        # so this branch only covers malformed asset data.
+        merged = {**_ASSET_DEFAULTS, **assets}
+        breakdown = {}
+        total_eur = 0
+        for field, currency, _ in _ASSET_SCHEMA:
+            value = merged[field]
+            breakdown[field] = {'value': value, 'currency': currency, 'value_eur': value}
+            total_eur += value
+        breakdown['total'] = {'value_eur': total_eur, 'currency': 'EUR'}
+        return breakdown
+
+def compute_financials(assets, monthly_salary, goal_percentage, exchange_rate=None, now=None):
+    """
+    Fused dashboard computation: resolve the exchange rate once, build the
+    asset breakdown (whose total doubles as the EUR asset sum), then derive
+    the income figures and global position from the same inputs. Callers
+    that need everything avoid walking the asset dict and fetching the rate
+    once per helper.
+    """
+    if exchange_rate is None:
+        exchange_rate = get_exchange_rate()
+
+    breakdown = get_asset_breakdown(assets, exchange_rate)
+    total_assets = breakdown['total']['value_eur']
+
+    realized_income = calculate_realized_monthly_income(monthly_salary, goal_percentage, now=now)
+    potential_income = calculate_potential_daily_income(monthly_salary, goal_percentage, now=now)
+
+    return {
+        'exchange_rate': exchange_rate,
+        'asset_breakdown': breakdown,
+        'total_assets': total_assets,
+        'realized_income': realized_income,
+        'potential_income': potential_income,
+        'global_position': round(total_assets + realized_income + potential_income, 2)
+    }
+
+def get_income_breakdown(monthly_salary, goal_percentage, now=None):
     """Get detailed breakdown of income components"""
     try:
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_day = now.day
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
-        
-        realized_income = calculate_realized_income(monthly_salary)
-        potential_income = calculate_potential_income(monthly_salary, goal_percentage)
-        
+        days_in_month = _days_in_month(now.year, now.month)
+
+        # Inline the income math against the day figures computed above
+        # instead of re-entering the public helpers, which would redo the
+        # date and month-length lookups
+        salary_ok = monthly_salary and monthly_salary > 0
+        realized_income = _realized_income(float(monthly_salary), current_day, days_in_month) if salary_ok else 0
+        if salary_ok and goal_percentage >= 0:
+            potential_income = _potential_income(float(monthly_salary), float(goal_percentage), days_in_month)
+        else:
+            potential_income = 0
+
+
         # Calculate remaining potential for the month
         remaining_days = days_in_month - current_day
         daily_income = monthly_salary / days_in_month if monthly_salary > 0 else 0
@@ -185,7 +270,7 @@ def get_income_breakdown(monthly_salary, goal_percentage):
         
         return breakdown
     
-    except Exception as e:
+    except Exception:
         return {
             'monthly_salary': monthly_salary or 0,
             'days_in_month': 30,
@@ -199,12 +284,13 @@ def get_income_breakdown(monthly_salary, goal_percentage):
             'progress_percentage': 0
         }
 
-def calculate_monthly_progress():
+def calculate_monthly_progress(now=None):
     """Calculate progress through the current month"""
     try:
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_day = now.day
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        days_in_month = _days_in_month(now.year, now.month)
         
         progress_percentage = (current_day / days_in_month) * 100
         
@@ -217,7 +303,7 @@ def calculate_monthly_progress():
             'year': now.year
         }
     
-    except Exception as e:
+    except Exception:
         return {
             'current_day': 1,
             'days_in_month': 30,
@@ -229,37 +315,39 @@ def calculate_monthly_progress():
 
 # Aliases and additional functions to match test expectations
 
-def calculate_realized_monthly_income(monthly_salary, goal_percentage):
+def calculate_realized_monthly_income(monthly_salary, goal_percentage, now=None):
     """
     Calculate income based on days passed and goal completion percentage
     This is the function expected by tests
     """
     if not monthly_salary or monthly_salary <= 0 or goal_percentage < 0:
         return 0
-    
+
     try:
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_day = now.day
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        days_in_month = _days_in_month(now.year, now.month)
         
         realized_income = (current_day / days_in_month) * monthly_salary * (goal_percentage / 100)
         return round(realized_income, 2)
     
-    except Exception as e:
+    except Exception:
         return 0
 
-def calculate_potential_daily_income(monthly_salary, goal_percentage):
+def calculate_potential_daily_income(monthly_salary, goal_percentage, now=None):
     """
     Calculate potential income for remaining days in month
     This is the function expected by tests
     """
     if not monthly_salary or monthly_salary <= 0 or goal_percentage < 0:
         return 0
-    
+
     try:
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_day = now.day
-        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        days_in_month = _days_in_month(now.year, now.month)
         remaining_days = days_in_month - current_day
         
         if remaining_days <= 0:
@@ -270,12 +358,12 @@ def calculate_potential_daily_income(monthly_salary, goal_percentage):
         
         return round(potential_income, 2)
     
-    except Exception as e:
+    except Exception:
         return 0
 
-def get_monthly_progress():
+def get_monthly_progress(now=None):
     """Return just the progress percentage as a float for test compatibility"""
-    progress_data = calculate_monthly_progress()
+    progress_data = calculate_monthly_progress(now)
     return progress_data['progress_percentage'] / 100.0  # Convert to 0-1 range
 
 def validate_percentage(value):
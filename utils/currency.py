@@ -1,48 +1,125 @@
 import requests
 import json
 import os
+import time
+import threading
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 # Cache file for exchange rates
 CACHE_FILE = 'data/exchange_rates.json'
 CACHE_DURATION_HOURS = 1  # Cache rates for 1 hour
 
+# In-memory copy of the last known rate so hot endpoints don't re-read the
+# cache file (or hit the network) on every call. The entry is tied to the
+# cache file's mtime so deleting/rewriting the file invalidates it.
+RATE_CACHE_TTL_SECONDS = 300  # Re-check the file/API at most every 5 minutes
+_rate_cache = None
+_fetch_lock = threading.Lock()
+
+# Memo of the last decoded cache document and its parsed timestamp, keyed
+# on (path, mtime): while the file is unchanged, repeated reads skip both
+# the JSON decode and the ISO-8601 parse
+_parse_cache = None
+
 # Fallback exchange rate (approximate USD to EUR)
 FALLBACK_RATE = 0.85
 
+# One Session for all API calls: connection pooling skips the TCP + TLS
+# handshake on repeat fetches to the same host
+_session = requests.Session()
+_session.headers.update({'Accept': 'application/json'})
+
+def _cache_file_mtime():
+    """Return the cache file's mtime in nanoseconds, or None if missing"""
+    try:
+        return os.stat(CACHE_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def _read_cache_file():
+    """
+    Read and decode the cache file, returning (cache_data, cached_time) or
+    None if the file is missing. The decoded document and parsed timestamp
+    are memoized against the file's mtime, so callers that hit an unchanged
+    file pay only a stat.
+    """
+    global _parse_cache
+    mtime = _cache_file_mtime()
+    if mtime is None:
+        return None
+
+    entry = _parse_cache
+    if entry is not None and entry[0] == (CACHE_FILE, mtime):
+        return entry[1], entry[2]
+
+    with open(CACHE_FILE, 'rb') as f:
+        raw = f.read()
+    cache_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Prefer the numeric ts_epoch twin when present: one C conversion
+    # instead of an ISO-8601 string parse. Older cache files (or ones
+    # written by hand) carry only the ISO timestamp.
+    ts_epoch = cache_data.get('ts_epoch')
+    if ts_epoch is not None:
+        cached_time = datetime.fromtimestamp(ts_epoch)
+    else:
+        cached_time = datetime.fromisoformat(cache_data['timestamp'])
+
+    _parse_cache = ((CACHE_FILE, mtime), cache_data, cached_time)
+    return cache_data, cached_time
+
 def get_exchange_rate():
     """
     Get USD to EUR exchange rate with caching and fallback
     """
+    global _rate_cache
     try:
-        # Try to get from cache first
-        cached_rate = get_cached_rate()
-        if cached_rate is not None:
-            return cached_rate
-        
-        # Fetch from API if cache is stale or doesn't exist
-        api_rate = fetch_rate_from_api()
-        if api_rate is not None:
-            cache_rate(api_rate)
-            return api_rate
-        
-        # Fallback to static rate
-        return FALLBACK_RATE
-    
-    except Exception as e:
+        # Serve from the in-memory copy while it is fresh and the file
+        # on disk hasn't changed underneath us
+        entry = _rate_cache
+        if (entry is not None and time.time() < entry['expires']
+                and entry['mtime'] == _cache_file_mtime()):
+            return entry['rate']
+
+        with _fetch_lock:
+            # Try to get from cache first
+            rate = get_cached_rate()
+
+            if rate is None:
+                # Fetch from API if cache is stale or doesn't exist
+                rate = fetch_rate_from_api()
+                if rate is not None:
+                    cache_rate(rate)
+
+            if rate is None:
+                # Fallback to static rate (not memoized, so the next call
+                # retries the API)
+                return FALLBACK_RATE
+
+            _rate_cache = {
+                'rate': rate,
+                'mtime': _cache_file_mtime(),
+                'expires': time.time() + RATE_CACHE_TTL_SECONDS
+            }
+            return rate
+
+    except Exception:
         return FALLBACK_RATE
 
 def get_cached_rate():
     """Get exchange rate from cache if still valid"""
     try:
-        if not os.path.exists(CACHE_FILE):
+        loaded = _read_cache_file()
+        if loaded is None:
             return None
-        
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
-        
+        cache_data, cached_time = loaded
+
         # Check if cache is still valid
-        cached_time = datetime.fromisoformat(cache_data['timestamp'])
         now = datetime.now()
         
         if now - cached_time < timedelta(hours=CACHE_DURATION_HOURS):
@@ -50,7 +127,7 @@ def get_cached_rate():
         
         return None
     
-    except Exception as e:
+    except Exception:
         return None
 
 def cache_rate(rate):
@@ -61,13 +138,20 @@ def cache_rate(rate):
         cache_data = {
             'rate': rate,
             'timestamp': datetime.now().isoformat(),
+            'ts_epoch': time.time(),  # Numeric twin of timestamp for cheap reads
             'source': 'api'
         }
         
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f, indent=4)
+        # The cache file is only ever read back by this module, so it is
+        # written compact — no indentation, no spaces around separators
+        if orjson is not None:
+            with open(CACHE_FILE, 'wb') as f:
+                f.write(orjson.dumps(cache_data))
+        else:
+            with open(CACHE_FILE, 'w') as f:
+                f.write(json.dumps(cache_data, separators=(',', ':')))
     
-    except Exception as e:
+    except Exception:
         pass  # Fail silently if caching doesn't work
 
 def fetch_rate_from_api():
@@ -79,7 +163,7 @@ def fetch_rate_from_api():
         # Free API endpoint (no API key required for basic usage)
         url = "https://api.exchangerate-api.com/v4/latest/USD"
         
-        response = requests.get(url, timeout=5)
+        response = _session.get(url, timeout=5)
         response.raise_for_status()
         
         data = response.json()
@@ -96,25 +180,23 @@ def fetch_rate_from_api():
     except (KeyError, ValueError, json.JSONDecodeError):
         # API response format error
         return None
-    except Exception as e:
+    except Exception:
         # Any other error
         return None
 
 def get_rate_info():
     """Get information about the current exchange rate and its source"""
     try:
-        if not os.path.exists(CACHE_FILE):
+        loaded = _read_cache_file()
+        if loaded is None:
             return {
                 'rate': FALLBACK_RATE,
                 'source': 'fallback',
                 'last_updated': 'Never',
                 'cache_valid': False
             }
-        
-        with open(CACHE_FILE, 'r') as f:
-            cache_data = json.load(f)
-        
-        cached_time = datetime.fromisoformat(cache_data['timestamp'])
+        cache_data, cached_time = loaded
+
         now = datetime.now()
         cache_valid = now - cached_time < timedelta(hours=CACHE_DURATION_HOURS)
         
@@ -146,7 +228,7 @@ def convert_usd_to_eur(usd_amount):
         
         return round(eur_amount, 2)
     
-    except Exception as e:
+    except Exception:
         return 0
 
 def refresh_exchange_rate():
@@ -164,5 +246,5 @@ def refresh_exchange_rate():
         
         return FALLBACK_RATE
     
-    except Exception as e:
+    except Exception:
         return FALLBACK_RATE 
\ No newline at end of file
@@ -1,142 +1,242 @@
 import json
+import mmap
 import os
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 CONFIG_FILE = 'data/user_config.json'
 ASSETS_FILE = 'data/assets.json'
 
+# In-process caches of the parsed JSON files. The files only change through
+# save_config()/save_assets(), so loads can skip the read + decode as long as
+# the file's mtime still matches the one recorded at cache time.
+_config_cache = None
+_assets_cache = None
+_config_mtime = None
+_assets_mtime = None
+
+# Once the data directory exists it stays existing for the process
+# lifetime, so remember that and skip the makedirs syscall on later calls
+_data_dir_ready = False
+
 def ensure_data_directory():
     """Ensure the data directory exists"""
+    global _data_dir_ready
+    if _data_dir_ready:
+        return
     os.makedirs('data', exist_ok=True)
+    _data_dir_ready = True
+
+# Static parts of the default documents, built once at import; timestamps
+# are stamped per instantiation in _default_document
+_DEFAULT_CONFIG = {'monthly_salary': 0, 'daily_goal_percentage': 0}
+_DEFAULT_ASSETS = {'bank_balance': 0, 'cash_eur': 0, 'cash_usd': 0, 'investments': 0}
+
+def _default_document(template):
+    """Clone a default template and stamp created_at/updated_at from a
+    single datetime.now() reading"""
+    document = dict(template)
+    now_iso = datetime.now().isoformat()
+    document['created_at'] = now_iso
+    document['updated_at'] = now_iso
+    return document
+
+def _read_json(path):
+    """
+    Parse a JSON file. With orjson available the file is memory-mapped and
+    decoded straight from the mapping, skipping the intermediate read() copy;
+    otherwise this is a plain json.load. Raises json.JSONDecodeError on
+    corrupted content either way (orjson's decode error is a subclass).
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            # These files are a few KB: one read() beats buffered streaming
+            return json.loads(f.read())
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty or unmappable file - fall back to a plain read
+            return orjson.loads(f.read())
+        try:
+            mv = memoryview(mm)
+            try:
+                return orjson.loads(mv)
+            finally:
+                mv.release()
+        finally:
+            mm.close()
+
+def _write_json(path, data):
+    """
+    Write JSON atomically: dump to a sibling temp file, then os.replace it
+    over the target. Readers never observe a partially written file, and a
+    crash mid-write leaves the previous version intact; the fsync before
+    the replace makes sure the rename never publishes unflushed data, so
+    the corrupted-file backup path effectively only covers external
+    writers. With orjson the
+    payload is encoded to bytes in a single C call; without it this falls
+    back to the stdlib encoder.
+    """
+    tmp_path = path + '.tmp'
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, 'w') as f:
+            # Single write of the full document instead of json.dump's
+            # per-token write() calls
+            f.write(json.dumps(data, indent=4))
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 def load_config():
     """Load user configuration from JSON file"""
+    global _config_cache, _config_mtime
     ensure_data_directory()
-    
+
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        if _config_cache is not None and _config_mtime == (CONFIG_FILE, mtime):
+            return dict(_config_cache)
+
+        config = _read_json(CONFIG_FILE)
+
+        _config_cache = dict(config)
+        _config_mtime = (CONFIG_FILE, mtime)
         return config
     except FileNotFoundError:
         # Return default configuration
-        default_config = {
-            'monthly_salary': 0,
-            'daily_goal_percentage': 0,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
+        default_config = _default_document(_DEFAULT_CONFIG)
         save_config(default_config)
         return default_config
     except json.JSONDecodeError:
         # Handle corrupted file - create backup and return default config
         backup_file(CONFIG_FILE)
-        default_config = {
-            'monthly_salary': 0,
-            'daily_goal_percentage': 0,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
+        default_config = _default_document(_DEFAULT_CONFIG)
         save_config(default_config)
         return default_config
 
 def save_config(config):
     """Save user configuration to JSON file"""
+    global _config_cache, _config_mtime
     ensure_data_directory()
-    
+
     config['updated_at'] = datetime.now().isoformat()
-    
+
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        _write_json(CONFIG_FILE, config)
     except Exception as e:
         raise Exception(f"Failed to save configuration: {str(e)}")
 
+    # Keep the cache in sync with what was just written
+    _config_cache = dict(config)
+    _config_mtime = (CONFIG_FILE, os.stat(CONFIG_FILE).st_mtime_ns)
+
 def load_assets():
     """Load asset data from JSON file"""
+    global _assets_cache, _assets_mtime
     ensure_data_directory()
-    
+
     try:
-        with open(ASSETS_FILE, 'r') as f:
-            assets = json.load(f)
+        mtime = os.stat(ASSETS_FILE).st_mtime_ns
+        if _assets_cache is not None and _assets_mtime == (ASSETS_FILE, mtime):
+            return dict(_assets_cache)
+
+        assets = _read_json(ASSETS_FILE)
+
+        _assets_cache = dict(assets)
+        _assets_mtime = (ASSETS_FILE, mtime)
         return assets
     except FileNotFoundError:
         # Return default assets
-        default_assets = {
-            'bank_balance': 0,
-            'cash_eur': 0,
-            'cash_usd': 0,
-            'investments': 0,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
+        default_assets = _default_document(_DEFAULT_ASSETS)
         save_assets(default_assets)
         return default_assets
     except json.JSONDecodeError:
         # Handle corrupted file - create backup and return default assets
         backup_file(ASSETS_FILE)
-        default_assets = {
-            'bank_balance': 0,
-            'cash_eur': 0,
-            'cash_usd': 0,
-            'investments': 0,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
+        default_assets = _default_document(_DEFAULT_ASSETS)
         save_assets(default_assets)
         return default_assets
 
 def save_assets(assets):
     """Save asset data to JSON file"""
+    global _assets_cache, _assets_mtime
     ensure_data_directory()
-    
+
     assets['updated_at'] = datetime.now().isoformat()
-    
+
     try:
-        with open(ASSETS_FILE, 'w') as f:
-            json.dump(assets, f, indent=4)
+        _write_json(ASSETS_FILE, assets)
     except Exception as e:
         raise Exception(f"Failed to save assets: {str(e)}")
 
+    # Keep the cache in sync with what was just written
+    _assets_cache = dict(assets)
+    _assets_mtime = (ASSETS_FILE, os.stat(ASSETS_FILE).st_mtime_ns)
+
 def backup_file(file_path):
     """Create a backup of a corrupted file"""
-    if os.path.exists(file_path):
-        backup_path = f"{file_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        try:
-            os.rename(file_path, backup_path)
-        except:
-            # If rename fails, just delete the corrupted file
-            os.remove(file_path)
+    backup_path = f"{file_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    try:
+        # Attempt the rename directly instead of paying a separate
+        # os.path.exists stat first
+        os.rename(file_path, backup_path)
+    except FileNotFoundError:
+        pass  # Nothing to back up
+    except OSError:
+        # If rename fails, just delete the corrupted file
+        os.remove(file_path)
+
+# Validation tables built once at import; validate_config/validate_assets
+# run on every POST, so there is no point rebuilding the lists per call.
+# Config rows are (field, lower bound, upper bound, range-error message).
+_CONFIG_SPEC = (
+    ('monthly_salary', 0, None, "Monthly salary must be a positive number"),
+    ('daily_goal_percentage', 0, 100, "Daily goal percentage must be between 0 and 100"),
+)
+REQUIRED_CONFIG_FIELDS = tuple(row[0] for row in _CONFIG_SPEC)
+REQUIRED_ASSET_FIELDS = ('bank_balance', 'cash_eur', 'cash_usd', 'investments')
+
+# Sentinel distinguishing "field absent" from any real value in a single
+# dict.get, so the validators need one lookup per field instead of a
+# membership test plus an indexing pass
+_MISSING = object()
 
 def validate_config(config):
     """Validate configuration data"""
-    required_fields = ['monthly_salary', 'daily_goal_percentage']
-    
-    for field in required_fields:
-        if field not in config:
+    # Single walk over the spec table: presence, type and range are
+    # checked per field in one pass. The exact type check skips
+    # isinstance's MRO walk (and rejects bools, which were never
+    # meaningful values here).
+    for field, lower, upper, message in _CONFIG_SPEC:
+        value = config.get(field, _MISSING)
+        if value is _MISSING:
             raise ValueError(f"Missing required field: {field}")
-    
-    # Validate data types and ranges
-    if not isinstance(config['monthly_salary'], (int, float)) or config['monthly_salary'] < 0:
-        raise ValueError("Monthly salary must be a positive number")
-    
-    if not isinstance(config['daily_goal_percentage'], (int, float)) or not 0 <= config['daily_goal_percentage'] <= 100:
-        raise ValueError("Daily goal percentage must be between 0 and 100")
-    
+        if (type(value) not in (int, float) or value < lower
+                or (upper is not None and value > upper)):
+            raise ValueError(message)
+
     return True
 
 def validate_assets(assets):
     """Validate asset data"""
-    required_fields = ['bank_balance', 'cash_eur', 'cash_usd', 'investments']
-    
-    for field in required_fields:
-        if field not in assets:
+    # Single pass per field (see validate_config)
+    for field in REQUIRED_ASSET_FIELDS:
+        value = assets.get(field, _MISSING)
+        if value is _MISSING:
             raise ValueError(f"Missing required field: {field}")
-    
-    # Validate data types
-    for field in required_fields:
-        if not isinstance(assets[field], (int, float)):
+        if type(value) not in (int, float):
             raise ValueError(f"{field} must be a number")
-    
+
     return True
 
 def get_data_summary():
@@ -151,7 +251,7 @@ def get_data_summary():
             'config_last_updated': config.get('updated_at', 'Unknown'),
             'assets_last_updated': assets.get('updated_at', 'Unknown'),
             'monthly_salary_configured': config.get('monthly_salary', 0) > 0,
-            'assets_configured': any(assets.get(field, 0) > 0 for field in ['bank_balance', 'cash_eur', 'cash_usd', 'investments'])
+            'assets_configured': any(assets.get(field, 0) > 0 for field in REQUIRED_ASSET_FIELDS)
         }
     except Exception as e:
         return {